@@ -0,0 +1,42 @@
+"""
+Optional Numba kernels for the pass-search hot path.
+
+numba is not a hard dependency: when it is missing (or fails to import)
+the kernels below are ``None`` and callers keep their NumPy code path.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+import numpy as np
+
+try:
+	from numba import njit  # type: ignore
+except Exception:
+	njit = None
+
+elevation_deg_kernel: Optional[Callable[..., np.ndarray]] = None
+
+if njit is not None:
+
+	@njit(cache=True, fastmath=True)
+	def _elevation_deg_kernel(r_teme_km, cos_t, sin_t, observer_km, up):
+		"""Fused TEME -> Earth-fixed -> elevation (deg) for ``(nsat, ntimes, 3)``."""
+		nsat = r_teme_km.shape[0]
+		ntimes = r_teme_km.shape[1]
+		out = np.empty((nsat, ntimes))
+		for k in range(ntimes):
+			c = cos_t[k]
+			s = sin_t[k]
+			for i in range(nsat):
+				x = r_teme_km[i, k, 0]
+				y = r_teme_km[i, k, 1]
+				dx = c * x + s * y - observer_km[0]
+				dy = c * y - s * x - observer_km[1]
+				dz = r_teme_km[i, k, 2] - observer_km[2]
+				rng = np.sqrt(dx * dx + dy * dy + dz * dz)
+				out[i, k] = np.degrees(np.arcsin((dx * up[0] + dy * up[1] + dz * up[2]) / rng))
+		return out
+
+	elevation_deg_kernel = _elevation_deg_kernel
@@ -6,9 +6,6 @@ from typing import Optional
 from . import __version__
 from .config import Config, load_config
 from .utils import ensure_dir, setup_logging, load_dotenv_if_present
-from .tle import fetch_tles, parse_tles, select_meteor_targets
-from .predict import find_passes, ObserverQTH
-from .scheduler import PassScheduler
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -75,13 +72,17 @@ def _apply_cli_overrides(cfg: Config, args: argparse.Namespace) -> Config:
 	return cfg
 
 
+# Subcommand handlers import .tle/.predict/.scheduler lazily so that
+# --help and --version don't pay for requests, skyfield or apscheduler.
+
 def _list_passes(cfg: Config, hours_override: Optional[int]) -> int:
+	from .predict import ObserverQTH, find_passes
+	from .tle import load_tles, select_meteor_targets
+
 	lookahead = int(hours_override) if hours_override else cfg.lookahead_hours
 	cache_dir = Path(cfg.paths.cache_dir)
 	ensure_dir(cache_dir)
-	text = fetch_tles(cache_dir)
-	triples = parse_tles(text)
-	targets = select_meteor_targets(triples)
+	targets = select_meteor_targets(load_tles(cache_dir))
 	if not targets:
 		print("No METEOR targets found in TLE set.")
 		return 1
@@ -106,11 +107,13 @@ def _list_passes(cfg: Config, hours_override: Optional[int]) -> int:
 
 
 def _run_scheduler(cfg: Config, dry_run: bool) -> int:
+	from .predict import ObserverQTH, find_passes
+	from .scheduler import PassScheduler
+	from .tle import load_tles, select_meteor_targets
+
 	cache_dir = Path(cfg.paths.cache_dir)
 	ensure_dir(cache_dir)
-	text = fetch_tles(cache_dir)
-	triples = parse_tles(text)
-	targets = select_meteor_targets(triples)
+	targets = select_meteor_targets(load_tles(cache_dir))
 	if not targets:
 		print("No METEOR targets found in TLE set.")
 		return 1
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import copy
 import os
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple
 
 from .utils import load_yaml_lazy
 
@@ -73,17 +75,25 @@ _ENV_MAP = {
 }
 
 
+def _make_setter(section: str, field_name: Optional[str]) -> Callable[[Config, Any], None]:
+	if field_name is None:
+		return lambda cfg, value: setattr(cfg, section, value)
+	return lambda cfg, value: setattr(getattr(cfg, section), field_name, value)
+
+
+# (env key, setter, caster) bound once at import
+_ENV_SETTERS = [
+	(key, _make_setter(section, field_name), caster)
+	for key, (section, field_name, caster) in _ENV_MAP.items()
+]
+
+
 def _apply_env_overrides(cfg: Config, env: Optional[dict] = None) -> Config:
-	env = env or os.environ
-	for key, (section, field_name, caster) in _ENV_MAP.items():
-		if key not in env:
-			continue
-		value = caster(env[key])
-		if field_name is None:
-			setattr(cfg, section, value)
-		else:
-			section_obj = getattr(cfg, section)
-			setattr(section_obj, field_name, value)
+	envget = (env if env is not None else os.environ).get
+	for key, setter, caster in _ENV_SETTERS:
+		value = envget(key)
+		if value is not None:
+			setter(cfg, caster(value))
 	return cfg
 
 
@@ -124,11 +134,35 @@ def _merge_from_mapping(cfg: Config, data: dict) -> Config:
 	return cfg
 
 
-def load_config(path: Optional[str] = None, env: Optional[dict] = None) -> Config:
+@lru_cache(maxsize=8)
+def _load_config_cached(
+	path: Optional[str],
+	mtime_ns: Optional[int],
+	overrides: Tuple[Tuple[str, str], ...],
+) -> Config:
+	# mtime_ns is only part of the cache key: an edited file misses the cache
 	cfg = Config()
 	if path:
 		data = load_yaml_lazy(path)
 		if isinstance(data, dict):
 			cfg = _merge_from_mapping(cfg, data)
-	cfg = _apply_env_overrides(cfg, env)
-	return cfg
+	return _apply_env_overrides(cfg, dict(overrides))
+
+
+def load_config(path: Optional[str] = None, env: Optional[dict] = None) -> Config:
+	"""
+	Build a Config from defaults, an optional YAML/JSON file and env overrides.
+
+	Results are memoized on the file's path and mtime plus the relevant
+	METEOR_AUTO_* variables; each call returns its own deep copy.
+	"""
+	env = env or os.environ
+	mtime_ns: Optional[int] = None
+	if path:
+		path = os.path.abspath(path)
+		try:
+			mtime_ns = os.stat(path).st_mtime_ns
+		except OSError:
+			pass
+	overrides = tuple((key, env[key]) for key in _ENV_MAP if key in env)
+	return copy.deepcopy(_load_config_cached(path, mtime_ns, overrides))
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import List, Tuple, Dict
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple, Dict
 
+import numpy as np
+from sgp4.api import Satrec, SatrecArray, jday
 from skyfield.api import EarthSatellite, load, wgs84
+from skyfield.sgp4lib import theta_GMST1982
+
+from ._kernels import elevation_deg_kernel
 
 
 @dataclass
@@ -24,85 +31,312 @@ class PassEvent:
 	duration_sec: int
 
 
-def _to_ts(ts, dt: datetime):
-	if dt.tzinfo is None:
-		dt = dt.replace(tzinfo=timezone.utc)
-	# Use Skyfield's from_datetime to avoid arg-shape ambiguity in ts.utc
-	return ts.from_datetime(dt)
+_TS = None
 
 
-def _elevation_deg(sat: EarthSatellite, qth: ObserverQTH, ts, t):
-	observer = wgs84.latlon(
-		qth.latitude_deg,
-		qth.longitude_deg,
-		elevation_m=qth.altitude_m,
-	)
-	topocentric = (sat - observer).at(t)
-	alt, _, _ = topocentric.altaz()
-	return float(alt.degrees)
+def _timescale():
+	"""Return a process-wide Skyfield timescale, loading it on first use."""
+	global _TS
+	if _TS is None:
+		_TS = load.timescale(builtin=True)
+	return _TS
 
 
-def find_passes(
-	sat_name_to_tle: Dict[str, Tuple[str, str]],
+@lru_cache(maxsize=16)
+def _observer_frame(
+	latitude_deg: float,
+	longitude_deg: float,
+	altitude_m: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+	"""Return the observer ITRF position (km) and its local unit up-vector."""
+	position = wgs84.latlon(latitude_deg, longitude_deg, elevation_m=altitude_m)
+	lat = np.radians(latitude_deg)
+	lon = np.radians(longitude_deg)
+	up = np.array([
+		np.cos(lat) * np.cos(lon),
+		np.cos(lat) * np.sin(lon),
+		np.sin(lat),
+	])
+	return position.itrs_xyz.km, up
+
+
+def _elevation_deg(
+	r_teme_km: np.ndarray,
+	theta: np.ndarray,
+	observer_km: np.ndarray,
+	up: np.ndarray,
+) -> np.ndarray:
+	"""
+	Elevation in degrees of TEME positions ``(..., ntimes, 3)``.
+
+	TEME is rotated into the Earth-fixed frame by the GMST angle ``theta``
+	(one per time sample); polar motion is ignored, which is far below the
+	accuracy needed for scheduling. Uses the fused Numba kernel when numba
+	is installed.
+	"""
+	cos_t = np.cos(theta)
+	sin_t = np.sin(theta)
+	if elevation_deg_kernel is not None and r_teme_km.ndim == 3:
+		return elevation_deg_kernel(r_teme_km, cos_t, sin_t, observer_km, up)
+	x = r_teme_km[..., 0]
+	y = r_teme_km[..., 1]
+	dx = cos_t * x + sin_t * y - observer_km[0]
+	dy = cos_t * y - sin_t * x - observer_km[1]
+	dz = r_teme_km[..., 2] - observer_km[2]
+	rng = np.sqrt(dx * dx + dy * dy + dz * dz)
+	return np.degrees(np.arcsin((dx * up[0] + dy * up[1] + dz * up[2]) / rng))
+
+
+def _elevation_deg_skyfield(satrecs: List[Satrec], t, observer) -> np.ndarray:
+	"""
+	Reference elevations through Skyfield's full pipeline (IAU 2000A
+	nutation, polar motion, aberration) for ``(nsat, ntimes)``.
+	"""
+	ts = _timescale()
+	rows = []
+	for satrec in satrecs:
+		alt, _, _ = (EarthSatellite.from_satrec(satrec, ts) - observer).at(t).altaz()
+		rows.append(alt.degrees)
+	# Propagation errors surface as NaN positions; treat them as set
+	return np.nan_to_num(np.array(rows), nan=-90.0)
+
+
+@lru_cache(maxsize=256)
+def _satrec(line1: str, line2: str) -> Satrec:
+	"""Parse and initialize a TLE once; keyed on its text, so updates miss."""
+	return Satrec.twoline2rv(line1, line2)
+
+
+_REFINE_TOL_SEC = 1.0
+_INV_PHI = (np.sqrt(5.0) - 1.0) / 2.0
+
+
+def _pass_bounds(above: np.ndarray) -> List[Tuple[int, int]]:
+	"""
+	Return ``(aos_index, los_index)`` pairs for a boolean above-horizon row.
+
+	A pass already in progress at the first sample starts there; a pass
+	still in progress at the last sample is dropped.
+	"""
+	edges = np.flatnonzero(above[1:] != above[:-1]) + 1
+	rises = edges[above[edges]]
+	sets = edges[~above[edges]]
+	if above[0]:
+		rises = np.concatenate(([0], rises))
+	return list(zip(rises.tolist(), sets.tolist()))
+
+
+def _bisect_crossings(
+	elev_at: Callable[[np.ndarray], np.ndarray],
+	lo: np.ndarray,
+	hi: np.ndarray,
+	lo_above: np.ndarray,
+	tol: float = _REFINE_TOL_SEC,
+) -> np.ndarray:
+	"""
+	Narrow horizon crossings bracketed by ``lo``/``hi`` offsets (seconds).
+
+	All brackets are bisected together; returns the ``hi`` side, i.e. the
+	first instant known to be on the far side of the crossing.
+	"""
+	while lo.size and np.max(hi - lo) > tol:
+		mid = 0.5 * (lo + hi)
+		same = (elev_at(mid) >= 0.0) == lo_above
+		lo = np.where(same, mid, lo)
+		hi = np.where(same, hi, mid)
+	return hi
+
+
+def _golden_peaks(
+	elev_at: Callable[[np.ndarray], np.ndarray],
+	lo: np.ndarray,
+	hi: np.ndarray,
+	tol: float = _REFINE_TOL_SEC,
+) -> np.ndarray:
+	"""Golden-section search for the elevation maximum inside each bracket."""
+	a, b = lo, hi
+	c = b - _INV_PHI * (b - a)
+	d = a + _INV_PHI * (b - a)
+	fc, fd = elev_at(c), elev_at(d)
+	while a.size and np.max(b - a) > tol:
+		left = fc > fd
+		a, b = np.where(left, a, c), np.where(left, d, b)
+		probe = np.where(left, b - _INV_PHI * (b - a), a + _INV_PHI * (b - a))
+		f_probe = elev_at(probe)
+		c, d, fc, fd = (
+			np.where(left, probe, d),
+			np.where(left, c, probe),
+			np.where(left, f_probe, fd),
+			np.where(left, fc, f_probe),
+		)
+	return 0.5 * (a + b)
+
+
+def _find_sat_passes(
+	sat_items: List[Tuple[str, Tuple[str, str]]],
 	qth: ObserverQTH,
+	start: datetime,
 	lookahead_hours: int,
 	min_elev_deg: float,
-	step_seconds: int = 10,
+	step_seconds: int,
+	high_accuracy: bool = False,
 ) -> List[PassEvent]:
+	"""Search passes for ``(name, (line1, line2))`` items from ``start``.
+
+	Top-level and built from plain values so it can run in a worker process.
 	"""
-	Predict passes by sampling elevations every ``step_seconds``.
-	Accurate enough for scheduling when using generous margins.
-	"""
-	ts = load.timescale()
-	start = datetime.now(timezone.utc)
-	end = start + timedelta(hours=lookahead_hours)
+	ts = _timescale()
+	n_steps = int(lookahead_hours * 3600 // step_seconds) + 1
+	offsets = np.arange(n_steps, dtype=float) * step_seconds
+	start_sec = start.second + start.microsecond / 1e6
+
+	# SGP4 expects UTC Julian dates; GMST wants UT1 from the timescale
+	jd0, fr0 = jday(start.year, start.month, start.day, start.hour, start.minute, start_sec)
+	t0 = ts.utc(start.year, start.month, start.day, start.hour, start.minute, start_sec)
+	ut1_jd, ut1_fr0 = t0.whole, t0.ut1_fraction
+	observer_km, up = _observer_frame(qth.latitude_deg, qth.longitude_deg, qth.altitude_m)
+	if high_accuracy:
+		observer = wgs84.latlon(qth.latitude_deg, qth.longitude_deg, elevation_m=qth.altitude_m)
+
+	def elevations(sats: List[Satrec], seconds: np.ndarray) -> np.ndarray:
+		if high_accuracy:
+			t = ts.utc(start.year, start.month, start.day, start.hour, start.minute, start_sec + seconds)
+			return _elevation_deg_skyfield(sats, t, observer)
+		days = seconds / 86400.0
+		errors, r_teme, _ = SatrecArray(sats).sgp4(np.full(days.shape, jd0), fr0 + days)
+		theta, _ = theta_GMST1982(ut1_jd, ut1_fr0 + days)
+		elev = _elevation_deg(r_teme, theta, observer_km, up)
+		# Samples SGP4 could not propagate (e.g. decayed orbits) count as set
+		return np.where(errors == 0, elev, -90.0)
+
+	names = [name for name, _ in sat_items]
+	satrecs = [_satrec(l1, l2) for _, (l1, l2) in sat_items]
+	elev = elevations(satrecs, offsets)
+	above = elev >= 0.0
 
 	passes: List[PassEvent] = []
 
-	for sat_name, (l1, l2) in sat_name_to_tle.items():
-		sat = EarthSatellite(l1, l2, sat_name, ts)
-		t = start
-		in_pass = False
-		aos_dt = None
-		peak_el = -90.0
-		peak_time = None
-		while t <= end:
-			elev = _elevation_deg(sat, qth, ts, _to_ts(ts, t))
-			if elev >= 0.0 and not in_pass:
-				# horizon crossing
-				in_pass = True
-				aos_dt = t
-				peak_el = elev
-				peak_time = t
-			elif in_pass:
-				if elev > peak_el:
-					peak_el = elev
-					peak_time = t
-				if elev < 0.0:
-					# End of pass
-					los_dt = t
-					if (
-						peak_el >= min_elev_deg
-						and aos_dt is not None
-						and peak_time is not None
-					):
-						passes.append(
-							PassEvent(
-								satellite_name=sat_name,
-								aos=aos_dt,
-								tca=peak_time,
-								los=los_dt,
-								max_elevation_deg=peak_el,
-								duration_sec=int((los_dt - aos_dt).total_seconds()),
-							)
-						)
-					# Reset
-					in_pass = False
-					aos_dt = None
-					peak_el = -90.0
-					peak_time = None
-			t += timedelta(seconds=step_seconds)
+	for row, sat_name in enumerate(names):
+		bounds = _pass_bounds(above[row])
+		if not bounds:
+			continue
+		single = [satrecs[row]]
+
+		def elev_at(seconds: np.ndarray) -> np.ndarray:
+			return elevations(single, seconds)[0]
+
+		aos_idx = np.array([b[0] for b in bounds])
+		los_idx = np.array([b[1] for b in bounds])
+		# A pass already up at the first sample keeps the window start
+		rising = aos_idx > 0
+		aos_t = offsets[aos_idx]
+		aos_t[rising] = _bisect_crossings(
+			elev_at,
+			offsets[aos_idx[rising] - 1],
+			offsets[aos_idx[rising]],
+			np.zeros(int(rising.sum()), dtype=bool),
+		)
+		los_t = _bisect_crossings(
+			elev_at,
+			offsets[los_idx - 1],
+			offsets[los_idx],
+			np.ones(len(bounds), dtype=bool),
+		)
+		peak_idx = np.array([
+			aos_i + int(np.argmax(elev[row, aos_i:los_i])) for aos_i, los_i in bounds
+		])
+		tca_t = _golden_peaks(
+			elev_at,
+			np.maximum(offsets[peak_idx] - step_seconds, aos_t),
+			np.minimum(offsets[peak_idx] + step_seconds, los_t),
+		)
+		peak_el = np.maximum(elev_at(tca_t), elev[row, peak_idx])
+
+		for k in range(len(bounds)):
+			if peak_el[k] < min_elev_deg:
+				continue
+			aos_dt = start + timedelta(seconds=float(aos_t[k]))
+			los_dt = start + timedelta(seconds=float(los_t[k]))
+			passes.append(
+				PassEvent(
+					satellite_name=sat_name,
+					aos=aos_dt,
+					tca=start + timedelta(seconds=float(tca_t[k])),
+					los=los_dt,
+					max_elevation_deg=float(peak_el[k]),
+					duration_sec=int((los_dt - aos_dt).total_seconds()),
+				)
+			)
+
+	return passes
+
+
+def _search_passes(
+	sat_items: List[Tuple[str, Tuple[str, str]]],
+	qth: ObserverQTH,
+	start: datetime,
+	lookahead_hours: int,
+	min_elev_deg: float,
+	step_seconds: int,
+	workers: Optional[int] = None,
+	high_accuracy: bool = False,
+) -> List[PassEvent]:
+	"""Run ``_find_sat_passes`` in-process or chunked over worker processes."""
+	args = (qth, start, lookahead_hours, min_elev_deg, step_seconds, high_accuracy)
+	passes: List[PassEvent] = []
+	if workers and workers > 1 and len(sat_items) > 1:
+		chunks = [sat_items[i::workers] for i in range(min(workers, len(sat_items)))]
+		with ProcessPoolExecutor(max_workers=len(chunks)) as ex:
+			futures = [ex.submit(_find_sat_passes, chunk, *args) for chunk in chunks]
+			for future in futures:
+				passes.extend(future.result())
+	else:
+		passes = _find_sat_passes(sat_items, *args)
 
 	# Sort by AOS
 	passes.sort(key=lambda p: p.aos)
 	return passes
+
+
+def find_passes(
+	sat_name_to_tle: Dict[str, Tuple[str, str]],
+	qth: ObserverQTH,
+	lookahead_hours: int,
+	min_elev_deg: float,
+	step_seconds: int = 60,
+	workers: Optional[int] = None,
+	high_accuracy: bool = False,
+) -> List[PassEvent]:
+	"""
+	Predict passes from a coarse elevation grid sampled every
+	``step_seconds``, refined to about a second.
+
+	All satellites are propagated over the grid in a single vectorized
+	SGP4 call. Horizon crossings found on the grid are then narrowed by
+	bisection and the culmination by golden-section search, so the coarse
+	step only has to be shorter than the briefest pass of interest.
+
+	With ``workers`` > 1 the targets are split across that many processes.
+	This is a library-level knob only (the CLI and UI do not set it); it
+	pays off for large catalogs or very long lookaheads, not for the few
+	METEOR/NOAA/METOP targets.
+
+	Elevations use SGP4's TEME frame rotated by GMST only, which is good to
+	arc-seconds and plenty for scheduling. ``high_accuracy=True`` routes
+	them through Skyfield's full nutation/aberration pipeline instead, at
+	several times the cost.
+	"""
+	if not sat_name_to_tle:
+		return []
+
+	start = datetime.now(timezone.utc)
+	return _search_passes(
+		list(sat_name_to_tle.items()),
+		qth,
+		start,
+		lookahead_hours,
+		min_elev_deg,
+		step_seconds,
+		workers,
+		high_accuracy,
+	)
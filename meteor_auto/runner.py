@@ -3,9 +3,10 @@ from __future__ import annotations
 import logging
 import subprocess
 import shutil
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import IO, List, Optional
 
 from .config import Config
 from .predict import PassEvent
@@ -14,6 +15,13 @@ from .utils import ensure_dir
 logger = logging.getLogger(__name__)
 
 
+def _drain_output(stream: IO[str]) -> None:
+	"""Forward SatDump output to the debug log as it arrives."""
+	with stream:
+		for line in stream:
+			logger.debug("SatDump: %s", line.rstrip())
+
+
 class SatDumpRunner:
 	def __init__(self, config: Config):
 		self.config = config
@@ -101,29 +109,36 @@ class SatDumpRunner:
 		try:
 			logger.info("Starting SatDump capture for %s", pass_event.satellite_name)
 			
-			# Run SatDump
-			result = subprocess.run(
+			# Run SatDump, streaming its output into the log line by line so
+			# a long pass never holds the whole transcript in memory
+			proc = subprocess.Popen(
 				cmd,
 				cwd=output_dir,
-				capture_output=True,
+				stdout=subprocess.PIPE,
+				stderr=subprocess.STDOUT,
 				text=True,
-				timeout=pass_event.duration_sec + 300  # Extra safety margin
+				errors="replace",
+				bufsize=1,
 			)
-			
-			# Log output
-			if result.stdout:
-				logger.debug("SatDump stdout: %s", result.stdout)
-			if result.stderr:
-				logger.debug("SatDump stderr: %s", result.stderr)
+			reader = threading.Thread(target=_drain_output, args=(proc.stdout,), daemon=True)
+			reader.start()
+			try:
+				returncode = proc.wait(timeout=pass_event.duration_sec + 300)  # Extra safety margin
+			except subprocess.TimeoutExpired:
+				proc.kill()
+				proc.wait()
+				raise
+			finally:
+				reader.join(timeout=5)
 			
 			# Check success
-			if result.returncode == 0 and self._check_capture_success(output_dir):
+			if returncode == 0 and self._check_capture_success(output_dir):
 				logger.info("Capture successful for %s", pass_event.satellite_name)
 				self._record_success(pass_event.satellite_name)
 				return True
 			else:
 				logger.warning("Capture failed for %s (returncode: %d)", 
-							  pass_event.satellite_name, result.returncode)
+							  pass_event.satellite_name, returncode)
 				self._record_failure(pass_event.satellite_name)
 				return False
 				
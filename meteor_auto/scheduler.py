@@ -1,14 +1,12 @@
 from __future__ import annotations
 
 import logging
+import os
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Optional
 
-from apscheduler.schedulers.blocking import BlockingScheduler
-from apscheduler.triggers.date import DateTrigger
-
 from .config import Config
 from .predict import PassEvent
 from .runner import SatDumpRunner
@@ -16,9 +14,14 @@ from .utils import ensure_dir
 
 logger = logging.getLogger(__name__)
 
+_STALE_LOCK_SEC = 4 * 3600
+
 
 class PassScheduler:
 	def __init__(self, config: Config):
+		# Imported here so merely importing this module stays cheap
+		from apscheduler.schedulers.blocking import BlockingScheduler
+
 		self.config = config
 		self.scheduler = BlockingScheduler()
 		self.runner = SatDumpRunner(config)
@@ -26,41 +29,63 @@ class PassScheduler:
 
 	def _is_locked(self) -> bool:
 		"""Check if another capture is already running."""
-		if not self.lock_file.exists():
-			return False
 		try:
-			# Check if lock is stale (older than 4 hours)
-			age_hours = (time.time() - self.lock_file.stat().st_mtime) / 3600
-			if age_hours > 4:
-				logger.warning("Removing stale lock file (age: %.1f hours)", age_hours)
-				self.lock_file.unlink()
-				return False
-			return True
-		except Exception:
+			st = os.stat(self.lock_file)
+		except OSError:
+			return False
+		# Check if lock is stale (older than 4 hours)
+		age_sec = time.time() - st.st_mtime
+		if age_sec > _STALE_LOCK_SEC:
+			logger.warning("Removing stale lock file (age: %.1f hours)", age_sec / 3600)
+			try:
+				os.unlink(self.lock_file)
+			except FileNotFoundError:
+				pass
+			except OSError:
+				return True
 			return False
+		return True
 
 	def _acquire_lock(self) -> bool:
-		"""Acquire capture lock."""
-		if self._is_locked():
-			return False
+		"""Acquire capture lock.
+
+		The lock file is created with O_CREAT|O_EXCL, so two schedulers racing
+		for the same pass cannot both win. A stale lock is removed and the
+		create is retried once.
+		"""
 		try:
 			ensure_dir(self.lock_file.parent)
-			self.lock_file.write_text(str(datetime.now().isoformat()), encoding="utf-8")
-			return True
 		except Exception as e:
 			logger.error("Failed to acquire lock: %s", e)
 			return False
+		for _ in range(2):
+			try:
+				fd = os.open(str(self.lock_file), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+			except FileExistsError:
+				if self._is_locked():
+					return False
+				continue
+			except OSError as e:
+				logger.error("Failed to acquire lock: %s", e)
+				return False
+			try:
+				os.write(fd, datetime.now().isoformat().encode("utf-8"))
+			finally:
+				os.close(fd)
+			return True
+		return False
 
 	def _release_lock(self) -> None:
 		"""Release capture lock."""
 		try:
-			if self.lock_file.exists():
-				self.lock_file.unlink()
+			self.lock_file.unlink(missing_ok=True)
 		except Exception as e:
 			logger.warning("Failed to release lock: %s", e)
 
 	def _schedule_capture(self, pass_event: PassEvent) -> None:
 		"""Schedule a single pass capture."""
+		from apscheduler.triggers.date import DateTrigger
+
 		# Add pre-start margin
 		start_time = pass_event.aos - timedelta(seconds=120)
 		
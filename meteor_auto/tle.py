@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import gzip
+import json
+import os
+import re
 import time
 import logging
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-
-import requests
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Tuple, Optional, TypeVar
 
 DEFAULT_TLE_URL = "https://celestrak.org/NORAD/elements/weather.txt"
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def _is_fresh(path: Path, max_age_hours: int) -> bool:
     if not path.exists():
@@ -19,38 +24,106 @@ def _is_fresh(path: Path, max_age_hours: int) -> bool:
     return age_seconds <= max_age_hours * 3600
 
 
-def fetch_tles(
+def _meta_path(cache_file: Path) -> Path:
+    return cache_file.with_name(cache_file.name + ".meta")
+
+
+def _load_validators(cache_file: Path) -> Dict[str, str]:
+    """Conditional-GET headers from the last download, if still applicable."""
+    if not cache_file.exists():
+        return {}
+    try:
+        meta = json.loads(_meta_path(cache_file).read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    headers: Dict[str, str] = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def _write_atomic(path: Path, data: str) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(data, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _download(url: str, cache_file: Path, timeout_sec: int, conditional: bool = True) -> None:
+    """
+    Stream ``url`` gzip-compressed into ``cache_file`` without holding the
+    body in memory; the file only appears once complete (atomic rename).
+
+    With ``conditional`` set, sends If-None-Match/If-Modified-Since from the
+    previous response; on 304 Not Modified only the cache mtime is
+    refreshed. Callers clear it when the cached copy could not be read, so
+    a broken cache is always replaced by a full download.
+    """
+    import requests  # only needed when the cache is stale
+
+    partial = cache_file.with_name(cache_file.name + ".part")
+    headers = _load_validators(cache_file) if conditional else {}
+    try:
+        with requests.get(url, timeout=timeout_sec, stream=True, headers=headers) as resp:
+            if resp.status_code == 304 and headers:
+                logger.info("TLEs not modified since last fetch")
+                os.utime(cache_file, None)
+                return
+            resp.raise_for_status()
+            with gzip.open(partial, "wb", compresslevel=6) as f:
+                for chunk in resp.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
+            meta = {
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+            }
+        partial.replace(cache_file)
+        _write_atomic(_meta_path(cache_file), json.dumps(meta))
+    finally:
+        # Never leave a half-written download behind for the next attempt
+        partial.unlink(missing_ok=True)
+
+
+def _read_cached(
     cache_dir: Path,
-    url: str = DEFAULT_TLE_URL,
-    max_age_hours: int = 6,
-    timeout_sec: int = 10,
-    backoff_attempts: int = 3,
-) -> str:
+    read: Callable[[Path], T],
+    url: str,
+    max_age_hours: int,
+    timeout_sec: int,
+    backoff_attempts: int,
+) -> T:
     """
-    Fetch TLE catalog text with on-disk caching and simple backoff.
+    Apply ``read`` to the TLE cache file, downloading it first if missing,
+    stale or unreadable.
 
-    If network fetch fails, returns the cached copy if available.
+    If network fetch fails, falls back to the cached copy if available.
     """
     cache_dir.mkdir(parents=True, exist_ok=True)
-    cache_file = cache_dir / "weather.tle"
+    cache_file = cache_dir / "weather.tle.gz"
 
+    # Only revalidate a cached copy we know we can read; otherwise a 304
+    # would keep pointing us back at the same broken file
+    conditional = True
     if _is_fresh(cache_file, max_age_hours):
         try:
-            return cache_file.read_text(encoding="utf-8")
+            return read(cache_file)
         except Exception:
-            pass
+            conditional = False
 
     last_err: Optional[Exception] = None
     for attempt in range(1, backoff_attempts + 1):
+        downloaded = False
         try:
             logger.info("Fetching TLEs from %s (attempt %d)", url, attempt)
-            resp = requests.get(url, timeout=timeout_sec)
-            resp.raise_for_status()
-            text = resp.text
-            cache_file.write_text(text, encoding="utf-8")
-            return text
+            _download(url, cache_file, timeout_sec, conditional)
+            downloaded = True
+            return read(cache_file)
         except Exception as e:
             last_err = e
+            if downloaded:
+                # The cache (possibly just revalidated by a 304) is unreadable
+                conditional = False
             logger.warning(
                 "TLE fetch failed (attempt %d/%d): %s",
                 attempt,
@@ -61,24 +134,88 @@ def fetch_tles(
 
     logger.error("TLE fetch failed. Using cached copy if available.")
     if cache_file.exists():
-        return cache_file.read_text(encoding="utf-8")
+        return read(cache_file)
     raise RuntimeError(f"Unable to fetch TLEs from {url}: {last_err}")
 
 
-def parse_tles(text: str) -> Dict[str, Tuple[str, str]]:
-    lines = [line.strip() for line in text.splitlines() if line.strip()]
-    triples: Dict[str, Tuple[str, str]] = {}
-    i = 0
-    while i + 2 < len(lines):
-        name = lines[i]
-        l1 = lines[i + 1]
-        l2 = lines[i + 2]
-        if l1.startswith("1 ") and l2.startswith("2 "):
-            triples[name] = (l1, l2)
-            i += 3
+def _read_text(path: Path) -> str:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return f.read()
+
+
+def _read_triples(path: Path) -> Dict[str, Tuple[str, str]]:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return {name: (l1, l2) for name, l1, l2 in parse_tles_iter(f)}
+
+
+def fetch_tles(
+    cache_dir: Path,
+    url: str = DEFAULT_TLE_URL,
+    max_age_hours: int = 6,
+    timeout_sec: int = 10,
+    backoff_attempts: int = 3,
+) -> str:
+    """
+    Fetch TLE catalog text with on-disk caching and simple backoff.
+
+    If network fetch fails, returns the cached copy if available.
+    """
+    return _read_cached(
+        cache_dir, _read_text, url, max_age_hours, timeout_sec, backoff_attempts
+    )
+
+
+def load_tles(
+    cache_dir: Path,
+    url: str = DEFAULT_TLE_URL,
+    max_age_hours: int = 6,
+    timeout_sec: int = 10,
+    backoff_attempts: int = 3,
+) -> Dict[str, Tuple[str, str]]:
+    """
+    Like ``parse_tles(fetch_tles(...))`` but parses the cache file as a
+    line stream, never materializing the whole catalog text.
+    """
+    return _read_cached(
+        cache_dir, _read_triples, url, max_age_hours, timeout_sec, backoff_attempts
+    )
+
+
+def parse_tles_iter(lines: Iterable[str]) -> Iterator[Tuple[str, str, str]]:
+    """
+    Yield ``(name, line1, line2)`` from any iterable of catalog lines.
+
+    Blank lines are ignored and stray lines are skipped until a valid
+    three-line entry lines up again.
+    """
+    window: Deque[str] = deque()
+    for raw in lines:
+        line = raw.strip()
+        if not line:
+            continue
+        window.append(line)
+        if len(window) < 3:
+            continue
+        if window[1].startswith("1 ") and window[2].startswith("2 "):
+            yield window[0], window[1], window[2]
+            window.clear()
         else:
-            i += 1
-    return triples
+            window.popleft()
+
+
+def parse_tles(text: str) -> Dict[str, Tuple[str, str]]:
+    lines = [line for line in map(str.strip, text.splitlines()) if line]
+
+    # Fast path: a well-formed catalog is strictly name/line1/line2 triples
+    names, l1s, l2s = lines[0::3], lines[1::3], lines[2::3]
+    if (
+        len(lines) % 3 == 0
+        and all(l1.startswith("1 ") for l1 in l1s)
+        and all(l2.startswith("2 ") for l2 in l2s)
+    ):
+        return dict(zip(names, zip(l1s, l2s)))
+
+    return {name: (l1, l2) for name, l1, l2 in parse_tles_iter(lines)}
 
 
 _METEOR_PATTERNS: List[str] = [
@@ -106,15 +243,25 @@ _METOP_PATTERNS: List[str] = [
 ]
 
 
+def _alternation(patterns: List[str]) -> "re.Pattern[str]":
+    return re.compile("|".join(map(re.escape, patterns)))
+
+
+# One compiled alternation per selector: a single scan per name instead of
+# one substring search per pattern
+_METEOR_RE = _alternation(_METEOR_PATTERNS)
+_BAND_RES = {
+    "lrpt": _alternation(_METEOR_PATTERNS + _NOAA_PATTERNS),
+    "hrpt": _alternation(_METOP_PATTERNS + _NOAA_PATTERNS),
+    "all": _alternation(_METEOR_PATTERNS + _NOAA_PATTERNS + _METOP_PATTERNS),
+}
+
+
 def select_meteor_targets(
     tles: Dict[str, Tuple[str, str]]
 ) -> Dict[str, Tuple[str, str]]:
-    selected: Dict[str, Tuple[str, str]] = {}
-    for name, pair in tles.items():
-        upper = name.upper()
-        if any(p in upper for p in _METEOR_PATTERNS):
-            selected[name] = pair
-    return selected
+    search = _METEOR_RE.search
+    return {name: pair for name, pair in tles.items() if search(name.upper())}
 
 
 def select_targets(
@@ -129,21 +276,5 @@ def select_targets(
       - hrpt: METOP-B/C (AHRPT), NOAA HRPT (15/19)
       - all: union of both
     """
-    bands = bands.lower()
-    selected: Dict[str, Tuple[str, str]] = {}
-    for name, pair in tles.items():
-        u = name.upper()
-        is_meteor = any(p in u for p in _METEOR_PATTERNS)
-        is_noaa = any(p in u for p in _NOAA_PATTERNS)
-        is_metop = any(p in u for p in _METOP_PATTERNS)
-
-        if bands == "lrpt":
-            if is_meteor or is_noaa:
-                selected[name] = pair
-        elif bands == "hrpt":
-            if is_metop or is_noaa:
-                selected[name] = pair
-        else:  # all
-            if is_meteor or is_noaa or is_metop:
-                selected[name] = pair
-    return selected
+    search = _BAND_RES.get(bands.lower(), _BAND_RES["all"]).search
+    return {name: pair for name, pair in tles.items() if search(name.upper())}
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import re
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Any, Optional
 from datetime import datetime, timezone
@@ -30,41 +33,58 @@ def setup_logging(log_dir: Path, console_level: int = logging.INFO) -> None:
 		datefmt="%Y-%m-%dT%H:%M:%SZ",
 	)
 	file_handler.setFormatter(file_fmt)
-	logger.addHandler(file_handler)
 
 	# Console handler
 	console_handler = logging.StreamHandler()
 	console_handler.setLevel(console_level)
 	console_fmt = logging.Formatter("%(levelname)s: %(message)s")
 	console_handler.setFormatter(console_fmt)
-	logger.addHandler(console_handler)
+
+	# Callers only enqueue records; a background listener thread does the
+	# formatting and file/console I/O
+	log_queue: queue.Queue = queue.Queue(-1)
+	logger.addHandler(QueueHandler(log_queue))
+	listener = QueueListener(
+		log_queue,
+		file_handler,
+		console_handler,
+		respect_handler_level=True,
+	)
+	listener.start()
+	atexit.register(listener.stop)
 
 
 def utc_now() -> datetime:
 	return datetime.now(timezone.utc)
 
 
+_LEADING_TABS = re.compile(r"^\t+", re.MULTILINE)
+
+
 def load_yaml_lazy(path: str | Path) -> Optional[dict[str, Any]]:
+	p = Path(path)
+	if p.suffix.lower() == ".json":
+		if not p.exists():
+			return None
+		try:
+			import orjson  # type: ignore
+		except Exception:
+			import json
+			return json.loads(p.read_bytes())  # type: ignore[no-any-return]
+		return orjson.loads(p.read_bytes())  # type: ignore[no-any-return]
 	# Lazy import to avoid hard dependency for --help
 	try:
 		import yaml  # type: ignore
 	except Exception:
 		return None
-	p = Path(path)
 	if not p.exists():
 		return None
+	# Prefer the libyaml-backed loader when PyYAML was built with it
+	loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 	# Read and normalize leading tabs to spaces for YAML compliance
 	text = p.read_text(encoding="utf-8")
-	lines: list[str] = []
-	for line in text.splitlines():
-		j = 0
-		while j < len(line) and line[j] == "\t":
-			j += 1
-		if j:
-			line = ("  " * j) + line[j:]
-		lines.append(line)
-	normalized = "\n".join(lines)
-	return yaml.safe_load(normalized)  # type: ignore[no-any-return]
+	normalized = _LEADING_TABS.sub(lambda m: "  " * len(m.group()), text)
+	return yaml.load(normalized, Loader=loader)  # type: ignore[no-any-return]
 
 
 def load_dotenv_if_present(env_path: Optional[str | Path] = None) -> None:
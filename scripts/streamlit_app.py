@@ -14,34 +14,48 @@ It does NOT replace the headless scheduler. Keep running
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone, timedelta
+from collections import deque
+from datetime import timezone, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, BinaryIO, Dict, List, Tuple
 
-import streamlit as st
+import numpy as np
+
+try:
+    import yaml as _yaml  # type: ignore
+except ImportError:  # only needed to save the config
+    _yaml = None
 
 from meteor_auto.config import Config, load_config
-from meteor_auto.predict import ObserverQTH, find_passes
-from meteor_auto.tle import (
-    fetch_tles,
-    parse_tles,
-    select_targets,
-)
-from meteor_auto.scheduler import PassScheduler
 from meteor_auto.utils import ensure_dir, setup_logging, load_dotenv_if_present
 
 
 # ---------- Helpers ----------
 
+_CONFIG_CANDIDATES = (
+    Path("configs/config.yaml"),
+    Path("configs/config.example.yaml"),
+)
+
+# Map antenna to bands and recommended min elevation
+_ANT_TO_BAND = {
+    "Dipole 137 MHz": "lrpt",
+    "L-band HRPT (dish)": "hrpt",
+}
+_ANT_TO_MIN = {
+    "Dipole 137 MHz": 15.0,
+    "L-band HRPT (dish)": 25.0,
+}
+_BANDS_MAP = {"LRPT": "lrpt", "HRPT": "hrpt", "All": "all"}
+
+
+@lru_cache(maxsize=1)
 def get_default_config_path() -> Path:
-    candidates = [
-        Path("configs/config.yaml"),
-        Path("configs/config.example.yaml"),
-    ]
-    for p in candidates:
+    for p in _CONFIG_CANDIDATES:
         if p.exists():
             return p
-    return candidates[0]
+    return _CONFIG_CANDIDATES[0]
 
 
 def config_to_mapping(cfg: Config) -> Dict[str, Any]:
@@ -78,66 +92,124 @@ def config_to_mapping(cfg: Config) -> Dict[str, Any]:
 
 
 def write_config_yaml(path: Path, data: Dict[str, Any]) -> None:
-    try:
-        import yaml  # type: ignore
-    except Exception as e:
-        raise RuntimeError("PyYAML is required to write config") from e
+    if _yaml is None:
+        raise RuntimeError("PyYAML is required to write config")
+    dumper = getattr(_yaml, "CSafeDumper", _yaml.SafeDumper)
+    # Serialize in memory, then hand the file a single write
+    text = _yaml.dump(data, Dumper=dumper, sort_keys=False)
     ensure_dir(path.parent)
-    with path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(data, f, sort_keys=False)
+    path.write_text(text, encoding="utf-8")
+
 
+# Beyond this much new data a backwards tail is cheaper than reading forward
+_FOLLOW_MAX_BYTES = 1_000_000
 
-def tail_text_file(path: Path, max_bytes: int = 20000) -> str:
+
+def _tail_bytes(f: BinaryIO, end: int, n_lines: int, block: int) -> bytes:
+    """Read backwards from offset ``end`` until ``n_lines`` full lines (plus
+    whatever follows the last newline) are in hand."""
+    pos = end
+    buf = b""
+    # One extra newline: the first block usually starts mid-line
+    while pos > 0 and buf.count(b"\n") <= n_lines:
+        step = min(block, pos)
+        pos -= step
+        f.seek(pos)
+        buf = f.read(step) + buf
+    return buf
+
+
+def _decode_lines(data: bytes, n_lines: int) -> List[str]:
+    lines = data.splitlines()[-n_lines:] if n_lines > 0 else []
+    return [line.decode("utf-8", errors="replace") for line in lines]
+
+
+def tail_lines(path: Path, n_lines: int = 500, block: int = 8192) -> str:
+    """Return the last ``n_lines`` lines of a text file.
+
+    Reads backwards in ``block``-sized chunks and stops as soon as enough
+    newlines have been seen, so the cost does not depend on file size.
+    """
     if not path.exists():
         return "(log file not found)"
-    size = path.stat().st_size
     with path.open("rb") as f:
-        if size > max_bytes:
-            f.seek(-max_bytes, 2)
-        data = f.read()
+        data = _tail_bytes(f, f.seek(0, 2), n_lines, block)
+    return "\n".join(_decode_lines(data, n_lines))
+
+
+def follow_log(path: Path, state: Dict[str, Any], n_lines: int = 500) -> str:
+    """Return the last ``n_lines`` lines, reading only bytes added since the
+    previous call.
+
+    ``state`` persists between calls (e.g. in ``st.session_state``). It is
+    reseeded from a backwards tail when the file is rotated (new inode),
+    truncated, swapped for another path, or has grown too much to be worth
+    reading forward. An unterminated last line is held back until complete.
+    """
     try:
-        return data.decode("utf-8", errors="replace")
-    except Exception:
-        return data.decode("latin-1", errors="replace")
+        stat = path.stat()
+    except FileNotFoundError:
+        state.clear()
+        return "(log file not found)"
+    buf = state.get("buf")
+    off = state.get("off", 0)
+    if (
+        buf is None
+        or buf.maxlen != n_lines
+        or state.get("path") != str(path)
+        or state.get("ino") != stat.st_ino
+        or stat.st_size < off
+        or stat.st_size - off > _FOLLOW_MAX_BYTES
+    ):
+        # Tail only up to the stat'd size: anything appended after the
+        # stat() is picked up by the forward read on the next call
+        with path.open("rb") as f:
+            data = _tail_bytes(f, stat.st_size, n_lines, 8192)
+        complete, sep, partial = data.rpartition(b"\n")
+        state.update(
+            path=str(path),
+            ino=stat.st_ino,
+            off=stat.st_size,
+            partial=partial,
+            buf=deque(_decode_lines(complete, n_lines) if sep else [], maxlen=n_lines),
+        )
+        return "\n".join(state["buf"])
+    if stat.st_size > off:
+        with path.open("rb") as f:
+            f.seek(off)
+            new = f.read(stat.st_size - off)
+        state["off"] = off + len(new)
+        *complete, state["partial"] = (state["partial"] + new).split(b"\n")
+        buf.extend(line.decode("utf-8", errors="replace") for line in complete)
+    return "\n".join(buf)
 
 
 # ---------- Time & presentation helpers ----------
 
-def utc_to_local(dt: datetime, utc_offset_hours: int) -> datetime:
-    """Convert an aware UTC datetime to a fixed-offset local time.
+def display_timezone(show_local: bool, utc_offset_hours: int) -> timezone:
+    """Return the timezone pass times are shown in.
 
     Parameters
-    - dt: timezone-aware datetime to convert. Must include tzinfo.
+    - show_local: if False, times are shown in UTC.
     - utc_offset_hours: Local timezone offset in hours relative to UTC
       (e.g., -5 for UTC−05:00). Valid range is [-12, 14].
 
     Returns
-    - datetime in the requested fixed-offset timezone.
+    - timezone.utc, or the requested fixed-offset timezone.
 
     Raises
-    - ValueError: if dt is naive or offset is out of range.
+    - ValueError: if the offset is out of range.
     """
-    if dt.tzinfo is None:
-        raise ValueError("dt must be timezone-aware (tzinfo is required)")
+    if not show_local:
+        return timezone.utc
     if not (-12 <= int(utc_offset_hours) <= 14):
         raise ValueError("utc_offset_hours must be between -12 and +14")
-    target_tz = timezone(timedelta(hours=int(utc_offset_hours)))
-    return dt.astimezone(target_tz)
+    return timezone(timedelta(hours=int(utc_offset_hours)))
 
 
-def format_time_for_display(
-    dt: datetime, show_local: bool, utc_offset_hours: int
-) -> str:
-    """Return an ISO 8601 string without microseconds in UTC or local time.
-
-    This is optimized for human readability in the UI; it keeps seconds
-    precision and includes the timezone offset when shown in local time.
-    """
-    if show_local:
-        base = utc_to_local(dt, utc_offset_hours)
-    else:
-        base = dt.astimezone(timezone.utc)
-    return base.replace(microsecond=0).isoformat()
+# Lower elevation bound (deg) of each quality bucket above "Low"
+_QUALITY_EDGES = np.array([25.0, 40.0, 60.0])
+_QUALITY_LABELS = np.array(["🟠 Low", "🟨 Fair", "🟩 Good", "🟢 Excellent"])
 
 
 def classify_pass_quality(max_el_deg: float) -> str:
@@ -149,457 +221,546 @@ def classify_pass_quality(max_el_deg: float) -> str:
     - 25–39°: Fair — may be OK with good setup
     - < 25°: Low — challenging; likely noisy
     """
-    if max_el_deg >= 60.0:
-        return "🟢 Excellent"
-    if max_el_deg >= 40.0:
-        return "🟩 Good"
-    if max_el_deg >= 25.0:
-        return "🟨 Fair"
-    return "🟠 Low"
+    return str(classify_pass_quality_array(np.array([max_el_deg]))[0])
+
+
+def classify_pass_quality_array(max_el_deg: np.ndarray) -> np.ndarray:
+    """Vectorized :func:`classify_pass_quality` over an array of elevations."""
+    return _QUALITY_LABELS[np.searchsorted(_QUALITY_EDGES, max_el_deg, side="right")]
 
 
 # ---------- UI ----------
 
-st.set_page_config(
-    page_title="meteor-auto",
-    page_icon=":material/satellite_alt:",
-    layout="wide",
-    initial_sidebar_state="expanded",
-)
+# Only the selected section is built on a rerun (st.tabs runs every tab's
+# body, including the self-refreshing logs fragment, even when hidden)
+_SECTION_CFG = "⚙️ Configuration"
+_SECTION_PASS = "🛰️ Pass prediction"
+_SECTION_LOGS = "📜 Logs"
+
+
+def main() -> None:
+    # Streamlit (and pandas with it) is imported here so the helpers above
+    # can be imported and tested without the UI stack
+    import pandas as pd
+    import streamlit as st
+
+    @st.cache_data(ttl=3600, show_spinner=False)
+    def cached_tle_text(cache_dir_str: str) -> str:
+        """Raw TLE catalog text, reused across reruns for up to an hour."""
+        from meteor_auto.tle import fetch_tles
+
+        return fetch_tles(Path(cache_dir_str))
+
+    @st.cache_data(max_entries=4, show_spinner=False)
+    def catalog_from_text(text: str) -> Dict[str, Tuple[str, str]]:
+        """Parsed catalog keyed by the text's content, so an hourly refresh
+        that returns the same TLEs skips the parse."""
+        from meteor_auto.tle import parse_tles
+
+        return parse_tles(text)
+
+    def cached_tles(cache_dir_str: str) -> Dict[str, Tuple[str, str]]:
+        return catalog_from_text(cached_tle_text(cache_dir_str))
+
+    @st.cache_data(ttl=300, max_entries=16, show_spinner=False)
+    def cached_passes(
+        targets: Dict[str, Tuple[str, str]],
+        qth: Tuple[float, float, float],
+        hours: int,
+        min_elev: float,
+    ) -> list:
+        """Pass search memoized per (targets, QTH, hours, min elevation).
+
+        The short TTL keeps the search window anchored close to "now".
+        """
+        from meteor_auto.predict import ObserverQTH, find_passes
+
+        lat, lon, alt = qth
+        observer = ObserverQTH(latitude_deg=lat, longitude_deg=lon, altitude_m=alt)
+        return find_passes(targets, observer, hours, min_elev)
+
+    @st.cache_resource(show_spinner=False)
+    def init_logging(logs_dir: str) -> None:
+        """Configure root logging once per server process, not on every rerun."""
+        ensure_dir(Path(logs_dir))
+        setup_logging(Path(logs_dir), console_level=logging.INFO)
+
+    @st.fragment(run_every=5)
+    def logs_panel(log_path: Path, n_lines: int) -> None:
+        """Log viewer that refreshes itself without rerunning the whole page."""
+        col_a, col_b = st.columns([1, 6])
+        with col_a:
+            # Clicking a button inside a fragment reruns only the fragment
+            st.button("Refresh logs", icon=":material/refresh:")
+        with col_b:
+            log_state = st.session_state.setdefault("log_state", {})
+            log_text = follow_log(log_path, log_state, n_lines=n_lines)
+            # A plain fixed-height text area: no syntax highlighting to redo
+            # on every refresh, and the browser only lays out what is visible
+            st.text_area(
+                "Log tail",
+                value=log_text,
+                height=400,
+                disabled=True,
+                label_visibility="collapsed",
+            )
 
-# Welcome toast (one-time per session)
-if "_welcomed" not in st.session_state:
-    st.toast(
-        "Welcome to meteor-auto dashboard!",
-        icon=":material/rocket_launch:",
-    )
-    st.session_state["_welcomed"] = True
-
-# Hero header with author credit and quick actions
-header_left, header_right = st.columns([5, 2], gap="large")
-with header_left:
-    st.title(
-        ":material/satellite_alt: METEOR Auto — LRPT Pass Scheduler"
-        " & Dashboard"
+    st.set_page_config(
+        page_title="meteor-auto",
+        page_icon=":material/satellite_alt:",
+        layout="wide",
+        initial_sidebar_state="expanded",
     )
-    st.caption(":material/badge: Developed by Diego Malpica, MD")
-with header_right:
-    st.link_button(
-        "GitHub",
-        url="https://github.com/strikerdlm/meteor",
-        icon=":material/open_in_new:",
-        use_container_width=True,
-    )
-    with st.popover(
-        ":material/info: About",
-        use_container_width=True,
-    ):
-        st.markdown(
-            """
-            - Predicts METEOR-M LRPT passes and plans SatDump runs
-            - Local control/monitor UI; keep headless scheduler running
-            - Configurable QTH, frequencies, pipelines, and paths
-            """
+
+    # Welcome toast (one-time per session)
+    if "_welcomed" not in st.session_state:
+        st.toast(
+            "Welcome to meteor-auto dashboard!",
+            icon=":material/rocket_launch:",
+        )
+        st.session_state["_welcomed"] = True
+
+    # Hero header with author credit and quick actions
+    header_left, header_right = st.columns([5, 2], gap="large")
+    with header_left:
+        st.title(
+            ":material/satellite_alt: METEOR Auto — LRPT Pass Scheduler"
+            " & Dashboard"
         )
+        st.caption(":material/badge: Developed by Diego Malpica, MD")
+    with header_right:
         st.link_button(
-            ":material/menu_book: Project README",
-            url="https://github.com/strikerdlm/meteor#readme",
-            icon=":material/menu_book:",
+            "GitHub",
+            url="https://github.com/strikerdlm/meteor",
+            icon=":material/open_in_new:",
             use_container_width=True,
         )
+        with st.popover(
+            ":material/info: About",
+            use_container_width=True,
+        ):
+            st.markdown(
+                """
+                - Predicts METEOR-M LRPT passes and plans SatDump runs
+                - Local control/monitor UI; keep headless scheduler running
+                - Configurable QTH, frequencies, pipelines, and paths
+                """
+            )
+            st.link_button(
+                ":material/menu_book: Project README",
+                url="https://github.com/strikerdlm/meteor#readme",
+                icon=":material/menu_book:",
+                use_container_width=True,
+            )
 
-with st.sidebar:
-    st.title("meteor-auto")
-    st.caption("Local dashboard (control/monitor)")
-
-    # Load .env if provided
-    dotenv_file = st.text_input(".env path (optional)", value="")
-    if st.button("Load .env", type="secondary"):
-        load_dotenv_if_present(dotenv_file or None)
-        st.success(".env loaded (if present)")
-
-    # Config path
-    cfg_path_str = st.text_input(
-        "Config path",
-        value=str(get_default_config_path()),
-        help="Path to YAML config. Will be created if missing.",
-    )
-    cfg_path = Path(cfg_path_str)
-
-    # Logging setup
-    cfg_for_logs = load_config(str(cfg_path) if cfg_path.exists() else None)
-    ensure_dir(Path(cfg_for_logs.paths.logs_dir))
-    setup_logging(
-        Path(cfg_for_logs.paths.logs_dir),
-        console_level=logging.INFO,
-    )
+    with st.sidebar:
+        st.title("meteor-auto")
+        st.caption("Local dashboard (control/monitor)")
+
+        # Batch the sidebar inputs so typing a path does not rerun the page
+        with st.form("sidebar_form", border=False):
+            dotenv_file = st.text_input(".env path (optional)", value="")
+            cfg_path_str = st.text_input(
+                "Config path",
+                value=str(get_default_config_path()),
+                help="Path to YAML config. Will be created if missing.",
+            )
+            apply_col, env_col = st.columns(2)
+            with apply_col:
+                st.form_submit_button("Apply", type="primary")
+            with env_col:
+                load_env = st.form_submit_button("Load .env", type="secondary")
+        if load_env:
+            load_dotenv_if_present(dotenv_file or None)
+            st.success(".env loaded (if present)")
+        cfg_path = Path(cfg_path_str)
+
+        log_lines = st.slider(
+            "Log lines",
+            min_value=50,
+            max_value=5000,
+            value=500,
+            step=50,
+            help="How many trailing lines the Logs tab shows.",
+        )
 
+        # One config load per rerun, shared by logging and the main panel
+        cfg = load_config(str(cfg_path) if cfg_path.exists() else None)
 
-cfg = load_config(str(cfg_path) if cfg_path.exists() else None)
-cfg_map = config_to_mapping(cfg)
+        init_logging(cfg.paths.logs_dir)
 
-tab_cfg, tab_pass, tab_logs = st.tabs(
-    [
-        "⚙️ Configuration",
-        "🛰️ Pass prediction",
-        "📜 Logs",
-    ]
-)
+    cfg_map = config_to_mapping(cfg)
 
-with tab_cfg:
-    st.subheader(":material/tune: Configuration")
-    with st.form("cfg_form"):
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            cfg_map["qth"]["lat"] = st.number_input(
-                "Lat (deg)", value=float(cfg_map["qth"]["lat"])
-            )
-            cfg_map["lookahead"] = st.number_input(
-                "Lookahead (h)", value=int(cfg_map["lookahead"])
-            )
-            cfg_map["frequencies"]["primary"] = st.number_input(
-                "Primary freq (Hz)",
-                value=float(cfg_map["frequencies"]["primary"]),
-            )
-            cfg_map["pipelines"]["primary"] = st.text_input(
-                "Primary pipeline",
-                value=cfg_map["pipelines"]["primary"],
-            )
-            cfg_map["paths"]["outputs"] = st.text_input(
-                "Outputs dir",
-                value=cfg_map["paths"]["outputs"],
-            )
-        with col2:
-            cfg_map["qth"]["lon"] = st.number_input(
-                "Lon (deg)", value=float(cfg_map["qth"]["lon"])
-            )
-            cfg_map["min_elev"] = st.number_input(
-                "Min elevation (deg)", value=float(cfg_map["min_elev"])
-            )
-            cfg_map["frequencies"]["backup"] = st.number_input(
-                "Backup freq (Hz)",
-                value=float(cfg_map["frequencies"]["backup"]),
-            )
-            cfg_map["pipelines"]["fallback"] = st.text_input(
-                "Fallback pipeline",
-                value=cfg_map["pipelines"]["fallback"],
-            )
-            cfg_map["paths"]["logs"] = st.text_input(
-                "Logs dir",
-                value=cfg_map["paths"]["logs"],
+    section = st.radio(
+        "Section",
+        options=[_SECTION_CFG, _SECTION_PASS, _SECTION_LOGS],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="section",
+    )
+
+    if section == _SECTION_CFG:
+        st.subheader(":material/tune: Configuration")
+        with st.form("cfg_form"):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                cfg_map["qth"]["lat"] = st.number_input(
+                    "Lat (deg)", value=float(cfg_map["qth"]["lat"])
+                )
+                cfg_map["lookahead"] = st.number_input(
+                    "Lookahead (h)", value=int(cfg_map["lookahead"])
+                )
+                cfg_map["frequencies"]["primary"] = st.number_input(
+                    "Primary freq (Hz)",
+                    value=float(cfg_map["frequencies"]["primary"]),
+                )
+                cfg_map["pipelines"]["primary"] = st.text_input(
+                    "Primary pipeline",
+                    value=cfg_map["pipelines"]["primary"],
+                )
+                cfg_map["paths"]["outputs"] = st.text_input(
+                    "Outputs dir",
+                    value=cfg_map["paths"]["outputs"],
+                )
+            with col2:
+                cfg_map["qth"]["lon"] = st.number_input(
+                    "Lon (deg)", value=float(cfg_map["qth"]["lon"])
+                )
+                cfg_map["min_elev"] = st.number_input(
+                    "Min elevation (deg)", value=float(cfg_map["min_elev"])
+                )
+                cfg_map["frequencies"]["backup"] = st.number_input(
+                    "Backup freq (Hz)",
+                    value=float(cfg_map["frequencies"]["backup"]),
+                )
+                cfg_map["pipelines"]["fallback"] = st.text_input(
+                    "Fallback pipeline",
+                    value=cfg_map["pipelines"]["fallback"],
+                )
+                cfg_map["paths"]["logs"] = st.text_input(
+                    "Logs dir",
+                    value=cfg_map["paths"]["logs"],
+                )
+            with col3:
+                cfg_map["qth"]["alt"] = st.number_input(
+                    "Alt (m)", value=float(cfg_map["qth"]["alt"])
+                )
+                cfg_map["satdump"]["path"] = st.text_input(
+                    "SatDump path",
+                    value=cfg_map["satdump"]["path"],
+                )
+                cfg_map["satdump"]["gain"] = st.number_input(
+                    "Gain (dB)",
+                    value=float(cfg_map["satdump"]["gain"]),
+                )
+                cfg_map["satdump"]["bias"] = st.checkbox(
+                    "Bias-tee",
+                    value=bool(cfg_map["satdump"]["bias"]),
+                )
+                cfg_map["satdump"]["samplerate"] = st.number_input(
+                    "Samplerate (sps)",
+                    value=int(cfg_map["satdump"]["samplerate"]),
+                )
+                cfg_map["satdump"]["agc"] = st.checkbox(
+                    "Enable AGC",
+                    value=bool(cfg_map["satdump"]["agc"]),
+                )
+                cfg_map["satdump"]["http_bind"] = st.text_input(
+                    "HTTP bind (optional)",
+                    value=str(cfg_map["satdump"]["http_bind"] or ""),
+                )
+                cfg_map["paths"]["cache"] = st.text_input(
+                    "Cache dir",
+                    value=cfg_map["paths"]["cache"],
+                )
+
+            submitted = st.form_submit_button(
+                "Save config",
+                type="primary",
+                icon=":material/save:",
             )
-        with col3:
-            cfg_map["qth"]["alt"] = st.number_input(
-                "Alt (m)", value=float(cfg_map["qth"]["alt"])
+            if submitted:
+                try:
+                    write_config_yaml(cfg_path, cfg_map)
+                    st.success(f"Saved: {cfg_path}")
+                except Exception as e:
+                    st.error(
+                        f"Failed to save config: {e}"
+                    )
+
+    if section == _SECTION_PASS:
+        st.subheader(":material/auto_awesome_motion: Pass prediction")
+        antenna = st.segmented_control(
+            "Antenna profile",
+            options=[
+                "Dipole 137 MHz",
+                "L-band HRPT (dish)",
+                "Custom",
+            ],
+            selection_mode="single",
+            default="Dipole 137 MHz",
+        )
+        with st.popover(
+            ":material/ruler: Dipole length helper",
+            use_container_width=True,
+        ):
+            st.caption("Quarter-wave V-dipole leg length (velocity factor 0.95)")
+            freq_mhz = st.number_input(
+                "Frequency (MHz)",
+                value=137.900 if antenna == "Dipole 137 MHz" else 137.100,
+                min_value=100.0,
+                max_value=300.0,
+                step=0.1,
             )
-            cfg_map["satdump"]["path"] = st.text_input(
-                "SatDump path",
-                value=cfg_map["satdump"]["path"],
+            c = 299_792_458.0  # m/s
+            leg_m = 0.25 * c / (freq_mhz * 1e6) * 0.95
+            leg_cm = leg_m * 100.0
+            leg_in = leg_m * 39.3701
+            st.metric(
+                "Leg length (each)",
+                f"{leg_cm:.1f} cm",
+                help=f"{leg_in:.2f} in",
             )
-            cfg_map["satdump"]["gain"] = st.number_input(
-                "Gain (dB)",
-                value=float(cfg_map["satdump"]["gain"]),
+            st.markdown(
+                """
+                - Cut two legs to the shown length and form a V at ~120°–135°.
+                - Mount outdoors with clear sky view. Keep coax away from elements.
+                - HRPT needs an L-band dish/helix; dipole is for 137 MHz LRPT/APT.
+                """
             )
-            cfg_map["satdump"]["bias"] = st.checkbox(
-                "Bias-tee",
-                value=bool(cfg_map["satdump"]["bias"]),
+        # Target set control (disabled when derived from antenna)
+        band_choice = st.segmented_control(
+            "Target set",
+            options=["LRPT", "HRPT", "All"],
+            selection_mode="single",
+            default=(
+                "LRPT" if _ANT_TO_BAND.get(antenna) == "lrpt"
+                else "HRPT" if _ANT_TO_BAND.get(antenna) == "hrpt"
+                else "LRPT"
+            ),
+            disabled=(antenna != "Custom"),
+        )
+        # Recommend higher min elevation for HRPT dish
+        rec_min = _ANT_TO_MIN.get(antenna, float(cfg.min_elevation_deg))
+        # Batch the search parameters so stepping a number does not rerun
+        with st.form("predict_form", border=False):
+            hours_override = st.number_input(
+                "Hours (override)",
+                value=cfg.lookahead_hours,
+                min_value=1,
+                max_value=168,
             )
-            cfg_map["satdump"]["samplerate"] = st.number_input(
-                "Samplerate (sps)",
-                value=int(cfg_map["satdump"]["samplerate"]),
+            min_elev_override = st.number_input(
+                "Min elevation (deg)",
+                value=max(cfg.min_elevation_deg, rec_min),
+                min_value=0.0,
+                max_value=90.0,
             )
-            cfg_map["satdump"]["agc"] = st.checkbox(
-                "Enable AGC",
-                value=bool(cfg_map["satdump"]["agc"]),
+            find_clicked = st.form_submit_button(
+                "Find passes",
+                icon=":material/satellite_alt:",
+                type="primary",
             )
-            cfg_map["satdump"]["http_bind"] = st.text_input(
-                "HTTP bind (optional)",
-                value=str(cfg_map["satdump"]["http_bind"] or ""),
+        if st.button(
+            "Reload TLEs",
+            icon=":material/cached:",
+            help="Drop the in-app TLE and pass caches; the next search starts fresh.",
+        ):
+            cached_tle_text.clear()
+            catalog_from_text.clear()
+            cached_passes.clear()
+            st.toast("TLE cache cleared", icon=":material/cached:")
+
+        st.divider()
+        tz_col1, tz_col2 = st.columns([2, 2])
+        with tz_col1:
+            show_local_time = st.toggle(
+                "Show times in local time",
+                value=True,
+                help=(
+                    "Convert from UTC to a fixed local offset.\n"
+                    "DST is not applied automatically."
+                ),
             )
-            cfg_map["paths"]["cache"] = st.text_input(
-                "Cache dir",
-                value=cfg_map["paths"]["cache"],
+        with tz_col2:
+            local_utc_offset = st.number_input(
+                "Local UTC offset (hours)",
+                value=-5,
+                min_value=-12,
+                max_value=14,
+                step=1,
+                help="Example: -5 for Eastern Standard Time (EST).",
             )
 
-        submitted = st.form_submit_button(
-            "Save config",
-            type="primary",
-            icon=":material/save:",
-        )
-        if submitted:
-            try:
-                write_config_yaml(cfg_path, cfg_map)
-                st.success(f"Saved: {cfg_path}")
-            except Exception as e:
-                st.error(
-                    f"Failed to save config: {e}"
-                )
-
-with tab_pass:
-    st.subheader(":material/auto_awesome_motion: Pass prediction")
-    antenna = st.segmented_control(
-        "Antenna profile",
-        options=[
-            "Dipole 137 MHz",
-            "L-band HRPT (dish)",
-            "Custom",
-        ],
-        selection_mode="single",
-        default="Dipole 137 MHz",
-    )
-    with st.popover(
-        ":material/ruler: Dipole length helper",
-        use_container_width=True,
-    ):
-        st.caption("Quarter-wave V-dipole leg length (velocity factor 0.95)")
-        freq_mhz = st.number_input(
-            "Frequency (MHz)",
-            value=137.900 if antenna == "Dipole 137 MHz" else 137.100,
-            min_value=100.0,
-            max_value=300.0,
-            step=0.1,
-        )
-        c = 299_792_458.0  # m/s
-        leg_m = 0.25 * c / (freq_mhz * 1e6) * 0.95
-        leg_cm = leg_m * 100.0
-        leg_in = leg_m * 39.3701
-        st.metric(
-            "Leg length (each)",
-            f"{leg_cm:.1f} cm",
-            help=f"{leg_in:.2f} in",
-        )
-        st.markdown(
-            """
-            - Cut two legs to the shown length and form a V at ~120°–135°.
-            - Mount outdoors with clear sky view. Keep coax away from elements.
-            - HRPT needs an L-band dish/helix; dipole is for 137 MHz LRPT/APT.
-            """
-        )
-    # Map antenna to bands and recommended min elevation
-    ant_to_band = {
-        "Dipole 137 MHz": "lrpt",
-        "L-band HRPT (dish)": "hrpt",
-    }
-    ant_to_min = {
-        "Dipole 137 MHz": 15.0,
-        "L-band HRPT (dish)": 25.0,
-    }
-    # Target set control (disabled when derived from antenna)
-    band_choice = st.segmented_control(
-        "Target set",
-        options=["LRPT", "HRPT", "All"],
-        selection_mode="single",
-        default=(
-            "LRPT" if ant_to_band.get(antenna) == "lrpt"
-            else "HRPT" if ant_to_band.get(antenna) == "hrpt"
-            else "LRPT"
-        ),
-        disabled=(antenna != "Custom"),
-    )
-    hours_override = st.number_input(
-        "Hours (override)",
-        value=cfg.lookahead_hours,
-        min_value=1,
-        max_value=168,
-    )
-    # Recommend higher min elevation for HRPT dish
-    rec_min = ant_to_min.get(antenna, float(cfg.min_elevation_deg))
-    min_elev_override = st.number_input(
-        "Min elevation (deg)",
-        value=max(cfg.min_elevation_deg, rec_min),
-        min_value=0.0,
-        max_value=90.0,
-    )
-
-    st.divider()
-    tz_col1, tz_col2 = st.columns([2, 2])
-    with tz_col1:
-        show_local_time = st.toggle(
-            "Show times in local time",
-            value=True,
-            help=(
-                "Convert from UTC to a fixed local offset.\n"
-                "DST is not applied automatically."
-            ),
-        )
-    with tz_col2:
-        local_utc_offset = st.number_input(
-            "Local UTC offset (hours)",
-            value=-5,
-            min_value=-12,
-            max_value=14,
-            step=1,
-            help="Example: -5 for Eastern Standard Time (EST).",
-        )
+        if find_clicked:
+            # Imported on demand so config edits and log views never pay for
+            # skyfield/sgp4/requests
+            from meteor_auto.tle import select_targets
+
+            cache_dir = Path(cfg.paths.cache_dir)
+            ensure_dir(cache_dir)
+            with st.status(
+                "Fetching TLEs and computing passes...",
+                expanded=True,
+            ) as status:
+                st.write("Loading TLEs...")
+                triples = cached_tles(str(cache_dir))
+                st.write("Selecting targets...")
+                # Derive from antenna unless Custom
+                if antenna != "Custom":
+                    bands = _ANT_TO_BAND.get(antenna, "lrpt")
+                else:
+                    bands = _BANDS_MAP[band_choice or "LRPT"]
+                targets = select_targets(triples, bands=bands)
+                st.write(f"Targets selected: {len(targets)} (bands='{bands}')")
+                if not targets:
+                    st.warning("No matching targets found in TLE set.")
+                    st.session_state.pop("last_passes", None)
+                    status.update(
+                        label="Done",
+                        state="complete",
+                        expanded=False,
+                    )
+                else:
+                    st.write("Computing passes...")
+                    passes = cached_passes(
+                        targets,
+                        (
+                            cfg.qth.latitude_deg,
+                            cfg.qth.longitude_deg,
+                            cfg.qth.altitude_m,
+                        ),
+                        int(hours_override),
+                        float(min_elev_override),
+                    )
+                    # Keep the result so the table and the dry-run button
+                    # survive later reruns without recomputing
+                    st.session_state["last_passes"] = passes
+                    msg = (
+                        f"Passes found: {len(passes)} "
+                        f"(min_el={float(min_elev_override)}, "
+                        f"hours={int(hours_override)})"
+                    )
+                    st.write(msg)
+                    if not passes:
+                        st.info("No passes within lookahead window.")
+                    status.update(
+                        label="Pass search complete",
+                        state="complete",
+                        expanded=False,
+                    )
 
-    if st.button(
-        "Find passes",
-        icon=":material/satellite_alt:",
-        type="primary",
-    ):
-        cache_dir = Path(cfg.paths.cache_dir)
-        ensure_dir(cache_dir)
-        with st.status(
-            "Fetching TLEs and computing passes...",
-            expanded=True,
-        ) as status:
-            st.write("Fetching TLEs...")
-            text = fetch_tles(cache_dir)
-            st.write("Parsing TLEs...")
-            triples = parse_tles(text)
-            st.write("Selecting targets...")
-            bands_map = {"LRPT": "lrpt", "HRPT": "hrpt", "All": "all"}
-            # Derive from antenna unless Custom
-            if antenna != "Custom":
-                bands = ant_to_band.get(antenna, "lrpt")
-            else:
-                bands = bands_map[band_choice or "LRPT"]
-            targets = select_targets(triples, bands=bands)
-            st.write(f"Targets selected: {len(targets)} (bands='{bands}')")
-            if not targets:
-                st.warning("No matching targets found in TLE set.")
-                status.update(
-                    label="Done",
-                    state="complete",
-                    expanded=False,
-                )
+        passes = st.session_state.get("last_passes")
+        if passes:
+            tz = display_timezone(show_local_time, int(local_utc_offset))
+            max_el = np.fromiter(
+                (p.max_elevation_deg for p in passes), dtype=np.float64, count=len(passes)
+            )
+            table = pd.DataFrame({
+                "satellite": [p.satellite_name for p in passes],
+                "aos": pd.to_datetime([p.aos for p in passes], utc=True).tz_convert(tz),
+                "tca": pd.to_datetime([p.tca for p in passes], utc=True).tz_convert(tz),
+                "los": pd.to_datetime([p.los for p in passes], utc=True).tz_convert(tz),
+                "max_el_deg": np.round(max_el, 1),
+                "quality": classify_pass_quality_array(max_el),
+                "duration_s": np.fromiter(
+                    (p.duration_sec for p in passes), dtype=np.int32, count=len(passes)
+                ),
+            })
+
+            if not show_local_time:
+                tz_label = "UTC"
             else:
-                st.write("Computing passes...")
-                qth = ObserverQTH(
-                    latitude_deg=cfg.qth.latitude_deg,
-                    longitude_deg=cfg.qth.longitude_deg,
-                    altitude_m=cfg.qth.altitude_m,
-                )
-                passes = find_passes(
-                    targets,
-                    qth,
-                    int(hours_override),
-                    float(min_elev_override),
-                )
-                msg = (
-                    f"Passes found: {len(passes)} "
-                    f"(min_el={float(min_elev_override)}, "
-                    f"hours={int(hours_override)})"
+                tz_label = f"UTC{int(local_utc_offset):+d}"
+            with st.popover(
+                ":material/help: What do these columns mean?",
+                use_container_width=True,
+            ):
+                st.markdown(
+                    f"""
+                    - **AOS**: start time when the satellite rises
+                      above your horizon ({tz_label}).
+                    - **TCA**: midpoint of the pass at the highest
+                      elevation ({tz_label}).
+                    - **LOS**: end time when the satellite sets
+                      below the horizon ({tz_label}).
+                    - **Max elevation (°)**: highest elevation;
+                      higher is usually stronger.
+                    - **Quality**: quick rule-of-thumb from
+                      max elevation.
+                    - **Duration (s)**: total time above horizon.
+                    """
                 )
-                st.write(msg)
-                if not passes:
-                    st.info("No passes within lookahead window.")
-                else:
-                    rows: List[Dict[str, Any]] = []
-                    for p in passes:
-                        rows.append({
-                            "satellite": p.satellite_name,
-                            "aos": format_time_for_display(
-                                p.aos, show_local_time, int(local_utc_offset)
-                            ),
-                            "tca": format_time_for_display(
-                                p.tca, show_local_time, int(local_utc_offset)
-                            ),
-                            "los": format_time_for_display(
-                                p.los, show_local_time, int(local_utc_offset)
-                            ),
-                            "max_el_deg": round(p.max_elevation_deg, 1),
-                            "quality": classify_pass_quality(
-                                p.max_elevation_deg
-                            ),
-                            "duration_s": p.duration_sec,
-                        })
-
-                    if not show_local_time:
-                        tz_label = "UTC"
-                    else:
-                        tz_label = f"UTC{int(local_utc_offset):+d}"
-                    with st.popover(
-                        ":material/help: What do these columns mean?",
-                        use_container_width=True,
-                    ):
-                        st.markdown(
-                            f"""
-                            - **AOS**: start time when the satellite rises
-                              above your horizon ({tz_label}).
-                            - **TCA**: midpoint of the pass at the highest
-                              elevation ({tz_label}).
-                            - **LOS**: end time when the satellite sets
-                              below the horizon ({tz_label}).
-                            - **Max elevation (°)**: highest elevation;
-                              higher is usually stronger.
-                            - **Quality**: quick rule-of-thumb from
-                              max elevation.
-                            - **Duration (s)**: total time above horizon.
-                            """
-                        )
 
-                    st.dataframe(
-                        rows,
-                        use_container_width=True,
-                        hide_index=True,
-                        column_config={
-                            "satellite": st.column_config.TextColumn(
-                                "Satellite",
-                                help="Spacecraft name",
-                            ),
-                            "aos": st.column_config.TextColumn(
-                                f"AOS start ({tz_label})",
-                            ),
-                            "tca": st.column_config.TextColumn(
-                                f"TCA peak ({tz_label})",
-                            ),
-                            "los": st.column_config.TextColumn(
-                                f"LOS end ({tz_label})",
-                            ),
-                            "max_el_deg": st.column_config.NumberColumn(
-                                "Max elevation (°)",
-                                format="%.1f",
-                            ),
-                            "quality": st.column_config.TextColumn(
-                                "Quality",
-                            ),
-                            "duration_s": st.column_config.NumberColumn(
-                                "Duration (s)",
-                                format="%d",
-                            ),
-                        },
-                    )
+            st.dataframe(
+                table,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "satellite": st.column_config.TextColumn(
+                        "Satellite",
+                        help="Spacecraft name",
+                    ),
+                    "aos": st.column_config.DatetimeColumn(
+                        f"AOS start ({tz_label})",
+                        format="YYYY-MM-DD HH:mm:ss",
+                    ),
+                    "tca": st.column_config.DatetimeColumn(
+                        f"TCA peak ({tz_label})",
+                        format="YYYY-MM-DD HH:mm:ss",
+                    ),
+                    "los": st.column_config.DatetimeColumn(
+                        f"LOS end ({tz_label})",
+                        format="YYYY-MM-DD HH:mm:ss",
+                    ),
+                    "max_el_deg": st.column_config.NumberColumn(
+                        "Max elevation (°)",
+                        format="%.1f",
+                    ),
+                    "quality": st.column_config.TextColumn(
+                        "Quality",
+                    ),
+                    "duration_s": st.column_config.NumberColumn(
+                        "Duration (s)",
+                        format="%d",
+                    ),
+                },
+            )
 
-                    if st.button(
-                        "Dry-run schedule these passes",
-                        icon=":material/play_circle:",
-                    ):
-                        with st.status(
-                            "Planning schedule (dry-run)...",
+            if st.button(
+                "Dry-run schedule these passes",
+                icon=":material/play_circle:",
+            ):
+                with st.status(
+                    "Planning schedule (dry-run)...",
+                    expanded=True,
+                ) as sched_status:
+                    from meteor_auto.scheduler import PassScheduler
+
+                    scheduler = PassScheduler(cfg)
+                    try:
+                        scheduler.schedule_passes(passes, dry_run=True)
+                        st.success(
+                            "Dry-run complete. See logs for details."
+                        )
+                        sched_status.update(
+                            label="Dry-run complete",
+                            state="complete",
+                            expanded=False,
+                        )
+                    except Exception as e:
+                        st.error(f"Dry-run failed: {e}")
+                        sched_status.update(
+                            label="Dry-run failed",
+                            state="error",
                             expanded=True,
-                        ) as sched_status:
-                            scheduler = PassScheduler(cfg)
-                            try:
-                                scheduler.schedule_passes(passes, dry_run=True)
-                                st.success(
-                                    "Dry-run complete. See logs for details."
-                                )
-                                sched_status.update(
-                                    label="Dry-run complete",
-                                    state="complete",
-                                    expanded=False,
-                                )
-                            except Exception as e:
-                                st.error(f"Dry-run failed: {e}")
-                                sched_status.update(
-                                    label="Dry-run failed",
-                                    state="error",
-                                    expanded=True,
-                                )
-                status.update(
-                    label="Pass search complete",
-                    state="complete",
-                    expanded=False,
-                )
+                        )
+
+    if section == _SECTION_LOGS:
+        st.subheader(":material/receipt_long: Logs")
+        log_path = Path(cfg.paths.logs_dir) / "meteor-auto.log"
+        logs_panel(log_path, log_lines)
+
 
-with tab_logs:
-    st.subheader(":material/receipt_long: Logs")
-    log_path = Path(cfg.paths.logs_dir) / "meteor-auto.log"
-    col_a, col_b = st.columns([1, 6])
-    with col_a:
-        if st.button("Refresh logs", icon=":material/refresh:"):
-            st.rerun()
-    with col_b:
-        log_text = tail_text_file(log_path)
-        st.code(log_text, language="log")
+if __name__ == "__main__":
+    main()
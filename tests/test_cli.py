@@ -0,0 +1,20 @@
+import subprocess
+import sys
+
+from meteor_auto.cli import main
+
+
+def test_version(capsys):
+	assert main(["--version"]) == 0
+	assert capsys.readouterr().out.strip()
+
+
+def test_cli_import_is_lightweight():
+	# --help/--version must not pull in the prediction/scheduling stack
+	code = (
+		"import sys, meteor_auto.cli; "
+		"heavy = {'skyfield', 'apscheduler', 'requests'} & set(sys.modules); "
+		"sys.exit(sorted(heavy) or 0)"
+	)
+	result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+	assert result.returncode == 0, result.stderr
@@ -28,3 +28,48 @@ def test_file_merge(tmp_path):
 	assert cfg.qth.altitude_m == 100
 	assert cfg.lookahead_hours == 6
 	assert cfg.min_elevation_deg == 15
+
+
+def test_json_config(tmp_path):
+	cfg_file = tmp_path / "cfg.json"
+	cfg_file.write_text('{"qth": {"lat": 4.6, "lon": -74.1, "alt": 2600}, "lookahead": 8}', encoding="utf-8")
+	cfg = load_config(str(cfg_file))
+	assert cfg.qth.latitude_deg == 4.6
+	assert cfg.qth.altitude_m == 2600
+	assert cfg.lookahead_hours == 8
+
+
+def test_env_overrides_nested_fields():
+	cfg = load_config(
+		None,
+		env={
+			"METEOR_AUTO_LAT": "-33.5",
+			"METEOR_AUTO_BIAS_TEE": "yes",
+			"METEOR_AUTO_CACHE_DIR": "/tmp/tle",
+		},
+	)
+	assert cfg.qth.latitude_deg == -33.5
+	assert cfg.satdump.bias_tee is True
+	assert cfg.paths.cache_dir == "/tmp/tle"
+	assert cfg.lookahead_hours == 24
+
+
+def test_load_config_memoized_copies_and_invalidation(tmp_path):
+	import os
+
+	cfg_file = tmp_path / "cfg.yaml"
+	cfg_file.write_text("lookahead: 6\n", encoding="utf-8")
+	a = load_config(str(cfg_file), env={"METEOR_AUTO_GAIN_DB": "30"})
+	b = load_config(str(cfg_file), env={"METEOR_AUTO_GAIN_DB": "30"})
+	assert a == b and a is not b
+	a.qth.latitude_deg = 0.0
+	assert load_config(str(cfg_file), env={"METEOR_AUTO_GAIN_DB": "30"}).qth.latitude_deg != 0.0
+
+	# Different env overrides are separate cache entries
+	assert load_config(str(cfg_file), env={"METEOR_AUTO_GAIN_DB": "12"}).satdump.gain_db == 12
+
+	# Editing the file (new mtime) is picked up
+	cfg_file.write_text("lookahead: 9\n", encoding="utf-8")
+	st = cfg_file.stat()
+	os.utime(cfg_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+	assert load_config(str(cfg_file), env={"METEOR_AUTO_GAIN_DB": "30"}).lookahead_hours == 9
@@ -1,6 +1,24 @@
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 
-from meteor_auto.predict import find_passes, ObserverQTH
+import numpy as np
+import pytest
+from skyfield.api import EarthSatellite, load, wgs84
+
+import meteor_auto.predict as predict
+from meteor_auto.predict import (
+	_bisect_crossings,
+	_find_sat_passes,
+	_golden_peaks,
+	_pass_bounds,
+	_search_passes,
+	find_passes,
+	ObserverQTH,
+)
+
+_L1 = "1 12345U 24001A   25060.00000000  .00000000  00000-0  00000-0 0  9991"
+_L2 = "2 12345 098.0000 200.0000 0001000  10.0000 350.0000 14.20600000100001"
+_QTH = ObserverQTH(latitude_deg=4.7110, longitude_deg=-74.0721, altitude_m=2640)
+_START = datetime(2025, 3, 1, 6, 0, tzinfo=timezone.utc)
 
 
 def test_find_passes_smoke():
@@ -10,7 +28,111 @@ def test_find_passes_smoke():
 	l2 = "2 12345 098.0000 200.0000 0001000  10.0000 350.0000 14.20600000100001"
 	tles = {name: (l1, l2)}
 	qth = ObserverQTH(latitude_deg=4.7110, longitude_deg=-74.0721, altitude_m=2640)
-	# Run a very short lookahead to keep runtime small; result may be empty
-	passes = find_passes(tles, qth, lookahead_hours=1, min_elev_deg=0.0, step_seconds=60)
+	# Short lookahead on a coarse grid keeps runtime small; result may be empty
+	passes = find_passes(tles, qth, lookahead_hours=1, min_elev_deg=0.0, step_seconds=600)
 	assert isinstance(passes, list)
 	# We don't require non-empty; just ensure function executes
+
+
+def test_pass_bounds_edges():
+	above = np.array([True, True, False, False, True, True, True, False, True])
+	# First pass is already in progress; the trailing one never sets
+	assert _pass_bounds(above) == [(0, 2), (4, 7)]
+
+
+def test_find_passes_workers_match_serial():
+	# Second satellite: same orbit shape, rotated plane and phase
+	l2b = "2 12345 098.0000 020.0000 0001000  10.0000 170.0000 14.20600000100001"
+	items = [("METEOR-M N2-3", (_L1, _L2)), ("METEOR-M N2-4", (_L1, l2b))]
+	# Same fixed start for both runs so window-edge passes cannot differ
+	start = datetime(2025, 3, 1, tzinfo=timezone.utc)
+	serial = _search_passes(items, _QTH, start, 12, 0.0, 60)
+	parallel = _search_passes(items, _QTH, start, 12, 0.0, 60, workers=2)
+	assert serial
+	assert parallel == serial
+
+
+def _fine_sweep(start, hours):
+	"""Independent 1 s Skyfield reference: (offsets, elevations)."""
+	ts = load.timescale(builtin=True)
+	sat = EarthSatellite(_L1, _L2, "SAT", ts)
+	observer = wgs84.latlon(_QTH.latitude_deg, _QTH.longitude_deg, elevation_m=_QTH.altitude_m)
+	sec = np.arange(0, hours * 3600 + 1, 1.0)
+	t = ts.utc(start.year, start.month, start.day, start.hour, start.minute, sec)
+	return sec, (sat - observer).at(t).altaz()[0].degrees
+
+
+def test_refined_passes_match_fine_sweep():
+	passes = _find_sat_passes([("SAT", (_L1, _L2))], _QTH, _START, 3, 0.0, 60)
+	sec, elev = _fine_sweep(_START, 3)
+	above = elev >= 0.0
+	edges = np.flatnonzero(above[1:] != above[:-1]) + 1
+	assert len(passes) == 2 and len(edges) == 4
+	for p, (rise, fall) in zip(passes, edges.reshape(-1, 2)):
+		peak = rise + int(np.argmax(elev[rise:fall]))
+		assert abs((p.aos - _START).total_seconds() - sec[rise]) <= 2.0
+		assert abs((p.los - _START).total_seconds() - sec[fall]) <= 2.0
+		assert abs((p.tca - _START).total_seconds() - sec[peak]) <= 5.0
+		assert abs(p.max_elevation_deg - elev[peak]) < 0.05
+
+
+def test_pass_in_progress_keeps_window_start():
+	first = _find_sat_passes([("SAT", (_L1, _L2))], _QTH, _START, 3, 0.0, 60)[0]
+	start = first.aos + timedelta(seconds=90)
+	passes = _find_sat_passes([("SAT", (_L1, _L2))], _QTH, start, 1, 0.0, 60)
+	assert passes[0].aos == start
+	assert abs(passes[0].los - first.los) <= timedelta(seconds=2)
+
+
+def test_bisect_crossings():
+	calls = []
+
+	def elev_at(s):
+		calls.append(s)
+		# Rising through the horizon at 40 s, setting at 100 s
+		return np.where(s < 70.0, s - 40.0, 100.0 - s)
+
+	got = _bisect_crossings(
+		elev_at,
+		np.array([0.0, 90.0]),
+		np.array([60.0, 150.0]),
+		np.array([False, True]),
+	)
+	assert np.all(got >= [40.0, 100.0]) and np.all(got - [40.0, 100.0] <= 1.0)
+
+	calls.clear()
+	empty = _bisect_crossings(elev_at, np.array([]), np.array([]), np.array([], dtype=bool))
+	assert empty.size == 0 and not calls
+
+
+def test_golden_peaks():
+	def elev_at(s):
+		return -((s - 37.3) ** 2)
+
+	got = _golden_peaks(elev_at, np.array([0.0]), np.array([120.0]))
+	assert abs(got[0] - 37.3) <= 1.0
+	assert _golden_peaks(elev_at, np.array([]), np.array([])).size == 0
+
+
+def test_elevation_kernel_matches_numpy(monkeypatch):
+	if predict.elevation_deg_kernel is None:
+		pytest.skip("numba not installed")
+	rng = np.random.default_rng(0)
+	r = rng.uniform(-8000.0, 8000.0, size=(3, 50, 3))
+	theta = rng.uniform(0.0, 2 * np.pi, size=50)
+	observer_km, up = predict._observer_frame(4.7110, -74.0721, 2640.0)
+	fast = predict._elevation_deg(r, theta, observer_km, up)
+	monkeypatch.setattr(predict, "elevation_deg_kernel", None)
+	slow = predict._elevation_deg(r, theta, observer_km, up)
+	np.testing.assert_allclose(fast, slow, atol=1e-9)
+
+
+def test_high_accuracy_agrees_with_fast_path():
+	items = [("SAT", (_L1, _L2))]
+	fast = _find_sat_passes(items, _QTH, _START, 3, 0.0, 60)
+	precise = _find_sat_passes(items, _QTH, _START, 3, 0.0, 60, high_accuracy=True)
+	assert len(fast) == len(precise) == 2
+	for a, b in zip(fast, precise):
+		assert abs(a.aos - b.aos) <= timedelta(seconds=2)
+		assert abs(a.los - b.los) <= timedelta(seconds=2)
+		assert abs(a.max_elevation_deg - b.max_elevation_deg) < 0.05
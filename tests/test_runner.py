@@ -0,0 +1,35 @@
+import logging
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from meteor_auto.config import load_config
+from meteor_auto.predict import PassEvent
+from meteor_auto.runner import SatDumpRunner
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script as fake SatDump")
+def test_capture_streams_output(tmp_path, caplog):
+	fake = tmp_path / "satdump"
+	fake.write_text(
+		"#!/bin/sh\n"
+		"echo 'progress 1'\n"
+		"echo 'warning on stderr' >&2\n"
+		"touch \"$3/image.png\"\n",
+		encoding="utf-8",
+	)
+	os.chmod(fake, 0o755)
+
+	cfg = load_config(None)
+	cfg.satdump.path = str(fake)
+	cfg.paths.outputs_dir = str(tmp_path / "out")
+	aos = datetime(2025, 3, 1, 6, 0, tzinfo=timezone.utc)
+	event = PassEvent("METEOR-M2 3", aos, aos + timedelta(minutes=5), aos + timedelta(minutes=10), 45.0, 600)
+
+	with caplog.at_level(logging.DEBUG, logger="meteor_auto.runner"):
+		assert SatDumpRunner(cfg).capture_pass(event)
+	messages = [r.getMessage() for r in caplog.records]
+	assert "SatDump: progress 1" in messages
+	assert "SatDump: warning on stderr" in messages
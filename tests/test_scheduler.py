@@ -0,0 +1,32 @@
+import os
+import time
+
+from meteor_auto.config import load_config
+from meteor_auto.scheduler import PassScheduler
+
+
+def _scheduler(tmp_path):
+	cfg = load_config(None)
+	cfg.paths.cache_dir = str(tmp_path)
+	return PassScheduler(cfg)
+
+
+def test_lock_is_exclusive(tmp_path):
+	first = _scheduler(tmp_path)
+	second = _scheduler(tmp_path)
+	assert first._acquire_lock()
+	assert not second._acquire_lock()
+	first._release_lock()
+	assert second._acquire_lock()
+	second._release_lock()
+	assert not (tmp_path / "capture.lock").exists()
+
+
+def test_stale_lock_is_replaced(tmp_path):
+	lock = tmp_path / "capture.lock"
+	lock.write_text("old", encoding="utf-8")
+	old = time.time() - 5 * 3600
+	os.utime(lock, (old, old))
+	sched = _scheduler(tmp_path)
+	assert sched._acquire_lock()
+	assert lock.read_text(encoding="utf-8") != "old"
@@ -0,0 +1,106 @@
+import importlib.util
+from datetime import timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_APP = Path(__file__).resolve().parents[1] / "scripts" / "streamlit_app.py"
+
+
+@pytest.fixture(scope="module")
+def app():
+	# The UI lives in main(), so importing the script only defines helpers
+	spec = importlib.util.spec_from_file_location("streamlit_app", _APP)
+	module = importlib.util.module_from_spec(spec)
+	spec.loader.exec_module(module)
+	return module
+
+
+def test_tail_lines(app, tmp_path):
+	log = tmp_path / "app.log"
+	log.write_text("".join(f"line {i}\n" for i in range(1000)), encoding="utf-8")
+	assert app.tail_lines(log, n_lines=3, block=16) == "line 997\nline 998\nline 999"
+	assert app.tail_lines(log, n_lines=5000).count("\n") == 999
+	assert app.tail_lines(tmp_path / "missing.log") == "(log file not found)"
+
+
+def test_follow_log_reads_appends_and_rotation(app, tmp_path):
+	log = tmp_path / "app.log"
+	log.write_text("a\nb\n", encoding="utf-8")
+	state = {}
+	assert app.follow_log(log, state, n_lines=3) == "a\nb"
+	with log.open("a", encoding="utf-8") as f:
+		f.write("c\nd")
+	# The unterminated "d" is held back until its newline arrives
+	assert app.follow_log(log, state, n_lines=3) == "a\nb\nc"
+	with log.open("a", encoding="utf-8") as f:
+		f.write("\n")
+	assert app.follow_log(log, state, n_lines=3) == "b\nc\nd"
+	# Rotation: a shorter file in its place starts over
+	log.unlink()
+	log.write_text("new\n", encoding="utf-8")
+	assert app.follow_log(log, state, n_lines=3) == "new"
+
+
+def test_follow_log_reseed_stops_at_stat_size(app, tmp_path, monkeypatch):
+	log = tmp_path / "app.log"
+	log.write_text("a\nb\n", encoding="utf-8")
+	tail_bytes = app._tail_bytes
+
+	def append_then_tail(f, end, n_lines, block):
+		# Another writer appends between follow_log's stat() and its read
+		with log.open("a", encoding="utf-8") as w:
+			w.write("late\n")
+		return tail_bytes(f, end, n_lines, block)
+
+	monkeypatch.setattr(app, "_tail_bytes", append_then_tail)
+	state = {}
+	assert app.follow_log(log, state, n_lines=5) == "a\nb"
+	monkeypatch.setattr(app, "_tail_bytes", tail_bytes)
+	assert app.follow_log(log, state, n_lines=5) == "a\nb\nlate"
+
+
+def test_follow_log_survives_truncation_during_reseed(app, tmp_path, monkeypatch):
+	log = tmp_path / "app.log"
+	log.write_text("a\nb\n", encoding="utf-8")
+	tail_bytes = app._tail_bytes
+
+	def truncate_then_tail(f, end, n_lines, block):
+		log.write_bytes(b"")
+		return tail_bytes(f, end, n_lines, block)
+
+	monkeypatch.setattr(app, "_tail_bytes", truncate_then_tail)
+	state = {}
+	assert app.follow_log(log, state, n_lines=5) == ""
+	monkeypatch.setattr(app, "_tail_bytes", tail_bytes)
+	log.write_text("c\n", encoding="utf-8")
+	assert app.follow_log(log, state, n_lines=5) == "c"
+
+
+def test_quality_buckets_match_scalar(app):
+	el = np.array([0.0, 24.9, 25.0, 39.9, 40.0, 59.9, 60.0, 90.0])
+	assert list(app.classify_pass_quality_array(el)) == [app.classify_pass_quality(e) for e in el]
+	assert app.classify_pass_quality(60.0) == "🟢 Excellent"
+	assert app.classify_pass_quality(24.9) == "🟠 Low"
+
+
+def test_display_timezone(app):
+	assert app.display_timezone(False, -5) is timezone.utc
+	assert app.display_timezone(True, -5) == timezone(timedelta(hours=-5))
+	with pytest.raises(ValueError):
+		app.display_timezone(True, 15)
+
+
+def test_write_config_yaml_round_trips(app, tmp_path):
+	import yaml
+
+	from meteor_auto.config import Config, load_config
+
+	cfg_file = tmp_path / "nested" / "config.yaml"
+	data = app.config_to_mapping(Config())
+	data["qth"]["lat"] = 4.6
+	app.write_config_yaml(cfg_file, data)
+	# Key order is kept so the saved file reads like the example config
+	assert list(yaml.safe_load(cfg_file.read_text(encoding="utf-8"))) == list(data)
+	assert load_config(str(cfg_file)).qth.latitude_deg == 4.6
@@ -1,4 +1,18 @@
-from meteor_auto.tle import parse_tles, select_meteor_targets
+import gzip
+import os
+
+import pytest
+
+import meteor_auto.tle as tle
+from meteor_auto.tle import (
+	_METEOR_PATTERNS,
+	_METOP_PATTERNS,
+	_NOAA_PATTERNS,
+	load_tles,
+	parse_tles,
+	select_meteor_targets,
+	select_targets,
+)
 
 
 def test_parse_and_select():
@@ -14,3 +28,141 @@ NOAA 19
 	assert "METEOR-M N2-3" in triples
 	sel = select_meteor_targets(triples)
 	assert any("METEOR" in name.upper() for name in sel.keys())
+
+
+def test_parse_resyncs_on_stray_lines():
+	text = """
+# stray header
+METEOR-M2 3
+1 57166U 23091A   25261.04012797 -.00000003  00000+0  17820-4 0  9991
+2 57166  98.6513 316.0145 0003051 230.5802 129.5107 14.24010387115785
+METEOR-M2 4
+1 59051U 24039A   25260.95590662  .00000025  00000+0  30851-4 0  9992
+2 59051  98.6612 219.2753 0006042 233.1365 126.9259 14.22380439 80567
+"""
+	triples = parse_tles(text)
+	assert set(triples) == {"METEOR-M2 3", "METEOR-M2 4"}
+	assert triples["METEOR-M2 4"][1].startswith("2 59051")
+
+
+def test_load_tles_streams_fresh_cache(tmp_path):
+	(tmp_path / "weather.tle.gz").write_bytes(gzip.compress((
+		"METEOR-M2 3\n"
+		"1 57166U 23091A   25261.04012797 -.00000003  00000+0  17820-4 0  9991\n"
+		"2 57166  98.6513 316.0145 0003051 230.5802 129.5107 14.24010387115785\n"
+	).encode()))
+	# A fresh cache must be parsed without touching the network
+	triples = load_tles(tmp_path, url="http://invalid.invalid/", backoff_attempts=0)
+	assert list(triples) == ["METEOR-M2 3"]
+
+
+def test_select_targets_bands_match_substring_rules():
+	names = [
+		"METEOR-M2 3", "Meteor-M N2-4", "METEOR-M 2", "NOAA 19", "noaa-15",
+		"NOAA 18", "METOP-B", "METOP-C", "METOP-A", "GOES 16",
+	]
+	tles = {name: ("1 x", "2 x") for name in names}
+
+	def expected(groups):
+		return {
+			n for n in names
+			if any(p in n.upper() for g in groups for p in g)
+		}
+
+	cases = {
+		"lrpt": [_METEOR_PATTERNS, _NOAA_PATTERNS],
+		"HRPT": [_METOP_PATTERNS, _NOAA_PATTERNS],
+		"all": [_METEOR_PATTERNS, _NOAA_PATTERNS, _METOP_PATTERNS],
+		# Unknown band values fall back to the union of all sets
+		"bogus": [_METEOR_PATTERNS, _NOAA_PATTERNS, _METOP_PATTERNS],
+	}
+	for bands, groups in cases.items():
+		assert set(select_targets(tles, bands=bands)) == expected(groups), bands
+
+
+class _FakeResponse:
+	def __init__(self, chunks=(), status_code=200, headers=None, error=None):
+		self.chunks = chunks
+		self.status_code = status_code
+		self.headers = headers or {}
+		self.error = error
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc):
+		return False
+
+	def raise_for_status(self):
+		pass
+
+	def iter_content(self, chunk_size):
+		yield from self.chunks
+		if self.error:
+			raise self.error
+
+
+_BODY = (
+	b"METEOR-M2 3\n"
+	b"1 57166U 23091A   25261.04012797 -.00000003  00000+0  17820-4 0  9991\n"
+	b"2 57166  98.6513 316.0145 0003051 230.5802 129.5107 14.24010387115785\n"
+)
+
+
+def test_failed_download_leaves_no_partial_file(tmp_path, monkeypatch):
+	resp = _FakeResponse([b"METEOR-M2 3\n"], error=ConnectionError("connection reset"))
+	monkeypatch.setattr("requests.get", lambda *a, **kw: resp)
+	monkeypatch.setattr(tle.time, "sleep", lambda s: None)
+	with pytest.raises(RuntimeError):
+		tle.fetch_tles(tmp_path, backoff_attempts=2)
+	assert list(tmp_path.iterdir()) == []
+
+
+def test_unreadable_fresh_cache_falls_back_to_network(tmp_path, monkeypatch):
+	(tmp_path / "weather.tle.gz").write_bytes(b"\xff\xfe not gzip")
+	monkeypatch.setattr("requests.get", lambda *a, **kw: _FakeResponse([_BODY]))
+	assert list(load_tles(tmp_path)) == ["METEOR-M2 3"]
+	assert tle.fetch_tles(tmp_path).encode() == _BODY
+
+
+def test_unreadable_cache_with_validators_is_downloaded_in_full(tmp_path, monkeypatch):
+	cache_file = tmp_path / "weather.tle.gz"
+	cache_file.write_bytes(b"\xff\xfe not gzip")
+	(tmp_path / "weather.tle.gz.meta").write_text('{"etag": "\\"abc\\""}', encoding="utf-8")
+	sent = []
+
+	def fake_get(url, **kw):
+		headers = kw.get("headers") or {}
+		sent.append(headers)
+		# A server honouring the validators would say "not modified"
+		if "If-None-Match" in headers:
+			return _FakeResponse(status_code=304)
+		return _FakeResponse([_BODY])
+
+	monkeypatch.setattr("requests.get", fake_get)
+	monkeypatch.setattr(tle.time, "sleep", lambda s: None)
+	assert list(load_tles(tmp_path)) == ["METEOR-M2 3"]
+	assert sent == [{}]
+
+
+def test_conditional_get_reuses_cache_on_304(tmp_path, monkeypatch):
+	sent = []
+	responses = [
+		_FakeResponse([_BODY], headers={"ETag": '"abc"', "Last-Modified": "Thu, 18 Sep 2025 00:00:00 GMT"}),
+		_FakeResponse(status_code=304),
+	]
+
+	def fake_get(url, **kw):
+		sent.append(kw.get("headers") or {})
+		return responses[len(sent) - 1]
+
+	monkeypatch.setattr("requests.get", fake_get)
+	assert tle.fetch_tles(tmp_path).encode() == _BODY
+	assert sent[0] == {}
+
+	cache_file = tmp_path / "weather.tle.gz"
+	os.utime(cache_file, (0, 0))  # make it stale
+	assert tle.fetch_tles(tmp_path).encode() == _BODY
+	assert sent[1]["If-None-Match"] == '"abc"'
+	assert sent[1]["If-Modified-Since"].startswith("Thu, 18 Sep 2025")
+	assert cache_file.stat().st_mtime > 0